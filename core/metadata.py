@@ -4,6 +4,9 @@ ExifTool-only bridge for PDF metadata operations.
 
 - I/O only (read/write). Merge/sort/dedupe belongs to ops/UI layers.
 - Writes are safe: copy original -> edit temp -> fsync -> atomic replace.
+  write_metadata_batch() edits files that share identical changes with one ExifTool run.
+- ExifTool commands go to persistent -stay_open processes (infra.exiftool_daemon)
+  when possible, so most calls do not pay the ExifTool start-up cost.
 - Windows-friendly:
   * Extended-length path support for long/UNC paths.
   * Atomic replace with polite retries for share violations (e.g., file open).
@@ -21,6 +24,8 @@ import tempfile
 import subprocess
 from typing import Dict, List, Optional, Tuple
 
+from infra import exiftool_daemon
+
 import logging
 logger = logging.getLogger("HSPMetaWizard.core.metadata")
 
@@ -135,6 +140,85 @@ def _replace_with_retries(src: str, dst: str, attempts: int = 6, base_sleep: flo
 _SUBPROC_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == "nt" else 0
 
 
+# --------------------------- read helpers ------------------------------------
+
+# Tags requested for a metadata read (with -G1 so PDF and XMP values stay apart)
+_READ_TAG_ARGS = (
+    "-PDF:Title", "-XMP-dc:Title",
+    "-PDF:Author", "-XMP-pdf:Author",
+    "-PDF:Subject", "-XMP-dc:Subject",
+    "-PDF:Keywords", "-XMP-pdf:Keywords",
+)
+
+
+def _source_key(path: str) -> str:
+    """Comparable form of a path as given to / echoed back by ExifTool (SourceFile)."""
+    if path.startswith("\\\\?\\UNC\\"):
+        path = "\\\\" + path[8:]
+    elif path.startswith("\\\\?\\"):
+        path = path[4:]
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _as_text(val) -> str:
+    if isinstance(val, str):
+        return val.strip()
+    if isinstance(val, list):
+        parts = [str(x).strip() for x in val if str(x).strip()]
+        return ", ".join(parts)
+    return ""
+
+
+def _pick_tag(d: dict, name: str) -> str:
+    """Value of a tag regardless of its -G1 group prefix (e.g. 'ExifTool:Error' for 'Error')."""
+    for k, v in d.items():
+        if k == name or k.endswith(":" + name):
+            return _as_text(v) if isinstance(v, (str, list)) else str(v)
+    return ""
+
+
+def _apply_read_fields(md: "PDFMetadata", d: dict) -> None:
+    """Fill title/author/subject/keywords from one ExifTool -json -G1 record."""
+
+    def _pick_text(*keys: str) -> str:
+        for k in keys:
+            txt = _as_text(d.get(k))
+            if txt:
+                return txt
+        return ""
+
+    md.title = _pick_text("PDF:Title", "XMP-dc:Title", "Title")
+    md.author = _pick_text("PDF:Author", "XMP-pdf:Author", "Author")
+
+    pdf_subject = _pick_text("PDF:Subject")
+    xmp_subject = _pick_text("XMP-dc:Subject")
+    if pdf_subject and xmp_subject and pdf_subject != xmp_subject:
+        logger.info(
+            "Subject mismatch for %s (PDF: %r, XMP-dc: %r). Using PDF:Subject.",
+            md.filepath,
+            pdf_subject,
+            xmp_subject,
+        )
+    md.subject = pdf_subject or xmp_subject or _pick_text("Subject")
+
+    # Prefer PDF Keywords because the UI table is meant to reflect file metadata.
+    md.keywords = _pick_text("PDF:Keywords", "XMP-pdf:Keywords", "Keywords")
+
+
+# --------------------------- change detection --------------------------------
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """
+    (st_mtime_ns, st_size) of `path`, or None if it cannot be stat'ed. Taken before a
+    read and compared later to tell whether metadata read back then is still current.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 # --------------------------- data container ----------------------------------
 
 class PDFMetadata:
@@ -206,14 +290,7 @@ class MetadataHandler:
         try:
             shutil.copy2(src, tmp)
 
-            cmd = [self.exiftool_path, "-overwrite_original"] + cmd_args + ["--", tmp]
-            res = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout_write,
-                creationflags=_SUBPROC_FLAGS,
-            )
+            res = self._exiftool(["-overwrite_original", *cmd_args, "--", tmp], self.timeout_write)
             if res.returncode != 0:
                 try:
                     os.remove(tmp)
@@ -221,24 +298,7 @@ class MetadataHandler:
                     pass
                 return False, f"ExifTool error: {res.stderr.strip() or 'unknown'}"
 
-            _fsync_path(tmp)
-            try:
-                _replace_with_retries(tmp, src)
-            except PermissionError:
-                try:
-                    os.remove(tmp)
-                except Exception:
-                    pass
-                return False, "The PDF appears to be open or locked. Close the file and retry."
-            except OSError as e:
-                try:
-                    os.remove(tmp)
-                except Exception:
-                    pass
-                return False, f"Error replacing file: {e}"
-
-            _fsync_path(src)
-            return True, ""
+            return self._replace_from_temp(tmp, src)
 
         except subprocess.TimeoutExpired:
             try:
@@ -255,6 +315,75 @@ class MetadataHandler:
                 pass
             return False, f"{generic_error_prefix}: {e}"
 
+    @staticmethod
+    def _replace_from_temp(tmp: str, src: str) -> Tuple[bool, str]:
+        """fsync the edited temp copy and atomically replace the original with it."""
+        _fsync_path(tmp)
+        try:
+            _replace_with_retries(tmp, src)
+        except PermissionError:
+            try:
+                os.remove(tmp)
+            except Exception:
+                pass
+            return False, "The PDF appears to be open or locked. Close the file and retry."
+        except OSError as e:
+            try:
+                os.remove(tmp)
+            except Exception:
+                pass
+            return False, f"Error replacing file: {e}"
+
+        _fsync_path(src)
+        return True, ""
+
+    def _run_exiftool_on_copies(self, filepaths: List[str], cmd_args: List[str]) -> List[Tuple[bool, str]]:
+        """
+        Safe-write pattern for many files sharing the same edit: copy each original →
+        run ONE ExifTool over all temp copies (listed in an -@ argfile) → fsync →
+        atomic replace per file. If the run fails for any file, every temp copy is
+        discarded and the files are redone one by one via _run_exiftool_on_copy(),
+        so errors stay per file. Returns (ok, error) per file, in input order.
+        """
+        temps: List[str] = []
+        ok = False
+        try:
+            for fp in filepaths:
+                folder = os.path.dirname(os.path.abspath(fp)) or "."
+                fd, temp_path = tempfile.mkstemp(suffix=".pdf", dir=folder)
+                os.close(fd)
+                temps.append(_safe_path(temp_path))
+                shutil.copy2(_safe_path(fp), temps[-1])
+
+            res = self._exiftool(
+                ["-overwrite_original", "-charset", "filename=utf8", *cmd_args],
+                self.timeout_write + len(filepaths),
+                files=temps,
+            )
+            ok = res.returncode == 0
+            if not ok:
+                logger.warning("Batch write failed (%s); writing files one by one.",
+                               res.stderr.strip() or "unknown")
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.warning("Batch write failed (%s); writing files one by one.", e)
+
+        if not ok:
+            for tmp in temps:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            return [
+                self._run_exiftool_on_copy(
+                    fp, cmd_args,
+                    timeout_error_msg="Timeout writing metadata",
+                    generic_error_prefix="Error writing metadata",
+                )
+                for fp in filepaths
+            ]
+
+        return [self._replace_from_temp(tmp, _safe_path(fp)) for fp, tmp in zip(filepaths, temps)]
+
     _FIELD_MAP = {
         "title": "Title",
         "author": "Author",
@@ -262,12 +391,63 @@ class MetadataHandler:
         "keywords": "Keywords",
     }
 
-    def __init__(self, exiftool_path: Optional[str] = None, timeout_read: int = 15, timeout_write: int = 30):
+    def __init__(
+        self,
+        exiftool_path: Optional[str] = None,
+        timeout_read: int = 15,
+        timeout_write: int = 30,
+        use_daemon: bool = True,
+    ):
         self.exiftool_path = _resolve_exiftool_path(exiftool_path)
         self.timeout_read = int(timeout_read)
         self.timeout_write = int(timeout_write)
+        self.use_daemon = use_daemon
         self._validate_exiftool()
 
+    def _exiftool(
+        self, args: List[str], timeout: float, files: Optional[List[str]] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run one ExifTool command: `args`, then `files` (if given) as file names.
+        Goes to a shared persistent ExifTool (infra.exiftool_daemon) when enabled; if that
+        is unavailable it runs a one-off process, passing `files` through an -@ argfile.
+        """
+        if self.use_daemon and exiftool_daemon.available(self.exiftool_path):
+            # Paths are absolute, so the "--" guard is not needed (in an argfile stream
+            # it would also turn the daemon's own -execute into a file name)
+            daemon_args = [a for a in args if a != "--"] + list(files or [])
+            if "filename=utf8" not in daemon_args:
+                # Argfile text is UTF-8; file names must be decoded the same way
+                daemon_args = ["-charset", "filename=utf8", *daemon_args]
+            try:
+                return exiftool_daemon.run(self.exiftool_path, daemon_args, timeout)
+            except (OSError, ValueError) as e:
+                logger.info("Persistent ExifTool unavailable (%s); running a one-off process.", e)
+
+        if files is None:
+            return subprocess.run(
+                [self.exiftool_path, *args],
+                capture_output=True, text=True, timeout=timeout, creationflags=_SUBPROC_FLAGS
+            )
+        argfile = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", suffix=".args", delete=False
+            ) as fh:
+                argfile = fh.name
+                fh.write("".join(f + "\n" for f in files))
+            return subprocess.run(
+                [self.exiftool_path, *args, "-@", argfile],
+                capture_output=True, text=True, encoding="utf-8",
+                timeout=timeout, creationflags=_SUBPROC_FLAGS
+            )
+        finally:
+            if argfile:
+                try:
+                    os.remove(argfile)
+                except OSError:
+                    pass
+
     def _validate_exiftool(self) -> None:
         if not self.exiftool_path:
             raise FileNotFoundError("ExifTool path not configured.")
@@ -282,20 +462,14 @@ class MetadataHandler:
     def check_pdf_security(self, filepath: str) -> Tuple[bool, bool, str]:
         p = _safe_path(filepath)
         try:
-            enc = subprocess.run(
-                [self.exiftool_path, "-s", "-s", "-s", "-Encrypted", "--", p],
-                capture_output=True, text=True, timeout=10, creationflags=_SUBPROC_FLAGS
-            )
+            enc = self._exiftool(["-s", "-s", "-s", "-Encrypted", "--", p], 10)
             if enc.returncode != 0:
                 msg = enc.stderr.strip() or "unknown error"
                 return False, True, f"ExifTool error: {msg}"
             if enc.stdout.strip().lower() == "yes":
                 return True, False, "Password protected"
 
-            quick = subprocess.run(
-                [self.exiftool_path, "-json", "-fast", "--", p],
-                capture_output=True, text=True, timeout=10, creationflags=_SUBPROC_FLAGS
-            )
+            quick = self._exiftool(["-json", "-fast", "--", p], 10)
             if quick.returncode != 0:
                 msg = quick.stderr.strip() or "unknown error"
                 return False, True, f"ExifTool error: {msg}"
@@ -322,24 +496,7 @@ class MetadataHandler:
 
         p = _safe_path(filepath)
         try:
-            res = subprocess.run(
-                [
-                    self.exiftool_path,
-                    "-json",
-                    "-G1",
-                    "-PDF:Title",
-                    "-XMP-dc:Title",
-                    "-PDF:Author",
-                    "-XMP-pdf:Author",
-                    "-PDF:Subject",
-                    "-XMP-dc:Subject",
-                    "-PDF:Keywords",
-                    "-XMP-pdf:Keywords",
-                    "--",
-                    p,
-                ],
-                capture_output=True, text=True, timeout=self.timeout_read, creationflags=_SUBPROC_FLAGS
-            )
+            res = self._exiftool(["-json", "-G1", *_READ_TAG_ARGS, "--", p], self.timeout_read)
             if res.returncode != 0:
                 md.error_message = f"ExifTool error: {res.stderr.strip() or 'unknown'}"
                 return md
@@ -347,40 +504,7 @@ class MetadataHandler:
             data = json.loads(res.stdout or "[]")
             if not data:
                 return md
-            d = data[0]
-
-            def _as_text(val) -> str:
-                if isinstance(val, str):
-                    return val.strip()
-                if isinstance(val, list):
-                    parts = [str(x).strip() for x in val if str(x).strip()]
-                    return ", ".join(parts)
-                return ""
-
-            def _pick_text(*keys: str) -> str:
-                for k in keys:
-                    txt = _as_text(d.get(k))
-                    if txt:
-                        return txt
-                return ""
-
-            md.title = _pick_text("PDF:Title", "XMP-dc:Title", "Title")
-            md.author = _pick_text("PDF:Author", "XMP-pdf:Author", "Author")
-
-            pdf_subject = _pick_text("PDF:Subject")
-            xmp_subject = _pick_text("XMP-dc:Subject")
-            if pdf_subject and xmp_subject and pdf_subject != xmp_subject:
-                logger.info(
-                    "Subject mismatch for %s (PDF: %r, XMP-dc: %r). Using PDF:Subject.",
-                    filepath,
-                    pdf_subject,
-                    xmp_subject,
-                )
-            md.subject = pdf_subject or xmp_subject or _pick_text("Subject")
-
-            # Prefer PDF Keywords because the UI table is meant to reflect file metadata.
-            md.keywords = _pick_text("PDF:Keywords", "XMP-pdf:Keywords", "Keywords")
-
+            _apply_read_fields(md, data[0])
             return md
 
         except subprocess.TimeoutExpired:
@@ -393,6 +517,61 @@ class MetadataHandler:
             md.error_message = f"Error reading metadata: {e}"
             return md
 
+    def read_metadata_batch(self, filepaths: List[str]) -> List[PDFMetadata]:
+        """
+        Read many PDFs with a single ExifTool process (paths passed via an -@ argfile),
+        instead of the three processes per file that read_metadata() needs.
+
+        Results are in input order. The security probe is folded into the same run
+        (Encrypted tag, per-file ExifTool:Error). Any file the batch cannot account
+        for - or the whole batch, if ExifTool fails outright - falls back to
+        read_metadata(), so results match the single-file path.
+        """
+        results = [PDFMetadata(fp) for fp in filepaths]
+        # Source key -> input indices; a path listed twice is read once and fanned back out
+        pending: Dict[str, List[int]] = {}
+        for i, md in enumerate(results):
+            if not os.path.exists(md.filepath):
+                md.is_corrupted = True
+                md.error_message = "File not found"
+            else:
+                pending.setdefault(_source_key(_safe_path(md.filepath)), []).append(i)
+        if not pending:
+            return results
+
+        data: List[dict] = []
+        try:
+            res = self._exiftool(
+                ["-json", "-G1", "-charset", "filename=utf8",
+                 "-Encrypted", "-ExifTool:Error", *_READ_TAG_ARGS],
+                self.timeout_read + len(pending),
+                files=[_safe_path(results[idx[0]].filepath) for idx in pending.values()],
+            )
+            # Non-zero exit just means some file failed; those are handled per entry below
+            data = json.loads(res.stdout or "[]")
+        except (subprocess.TimeoutExpired, json.JSONDecodeError, OSError, ValueError) as e:
+            logger.warning("Batch metadata read failed (%s); reading files one by one.", e)
+            data = []
+
+        for d in data:
+            for i in pending.pop(_source_key(str(d.get("SourceFile", ""))), ()):
+                md = results[i]
+                error = _pick_tag(d, "Error")
+                if error:
+                    md.is_corrupted = True
+                    md.error_message = f"ExifTool error: {error}"
+                elif _pick_tag(d, "Encrypted").lower() == "yes":
+                    md.is_protected = True
+                    md.error_message = "Password protected"
+                else:
+                    _apply_read_fields(md, d)
+
+        for idx in pending.values():
+            md = self.read_metadata(results[idx[0]].filepath)
+            for i in idx:
+                results[i] = md
+        return results
+
     # ---------------------------- write/update --------------------------------
 
     def write_metadata(
@@ -418,6 +597,19 @@ class MetadataHandler:
             if is_corr:
                 return False, f"Cannot modify corrupted PDF: {msg or 'Corrupted'}"
 
+        cmd_args = self._update_args(updates)
+        if not cmd_args:
+            return True, ""
+
+        return self._run_exiftool_on_copy(
+            filepath,
+            cmd_args,
+            timeout_error_msg="Timeout writing metadata",
+            generic_error_prefix="Error writing metadata",
+        )
+
+    def _update_args(self, updates: Dict[str, Optional[str]]) -> List[str]:
+        """ExifTool tag assignments for write_metadata(); empty values are dropped."""
         # Map logical field -> ExifTool tag name and filter out empties
         filtered: Dict[str, str] = {}
         for k, v in (updates or {}).items():
@@ -430,9 +622,6 @@ class MetadataHandler:
             if tag:
                 filtered[tag] = v
 
-        if not filtered:
-            return True, ""
-
         # Build ExifTool tag arguments.
         cmd_args: List[str] = []
         for tag, value in filtered.items():
@@ -445,13 +634,7 @@ class MetadataHandler:
                     cmd_args.append(f"-{tag}={t}")
             else:
                 cmd_args.append(f"-{tag}={value}")
-
-        return self._run_exiftool_on_copy(
-            filepath,
-            cmd_args,
-            timeout_error_msg="Timeout writing metadata",
-            generic_error_prefix="Error writing metadata",
-        )
+        return cmd_args
 
     # ------------------------------- clear ------------------------------------
 
@@ -478,22 +661,62 @@ class MetadataHandler:
             if is_corr:
                 return False, f"Cannot modify corrupted PDF: {msg or 'Corrupted'}"
 
+        cmd_args = self._clear_args(fields)
+        if not cmd_args:
+            return True, ""  # nothing to clear
+
+        return self._run_exiftool_on_copy(
+            filepath,
+            cmd_args,
+            timeout_error_msg="Timeout clearing metadata",
+            generic_error_prefix="Error clearing metadata",
+        )
+
+    def _clear_args(self, fields: List[str]) -> List[str]:
+        """ExifTool empty assignments (-Tag=) for clear_metadata_fields(), de-duplicated."""
         # Map logical field names to ExifTool tags, de-dup
         tags: List[str] = []
         for f in fields or []:
             tag = self._FIELD_MAP.get(str(f).lower())
             if tag and tag not in tags:
                 tags.append(tag)
+        # -Tag= clears the value.
+        return [f"-{tag}=" for tag in tags]
 
-        if not tags:
-            return True, ""  # nothing to clear
+    # ------------------------------ batch -------------------------------------
 
-        # Build ExifTool tag arguments: -Tag= clears the value.
-        cmd_args = [f"-{tag}=" for tag in tags]
+    def write_metadata_batch(
+        self,
+        items: List[Tuple[str, Dict[str, Optional[str]], List[str]]],
+    ) -> List[Tuple[bool, str]]:
+        """
+        Apply (filepath, updates, clear_fields) edits - write_metadata() followed by
+        clear_metadata_fields() - using one ExifTool process per group of files whose
+        edits are identical, instead of one or two processes per file.
 
-        return self._run_exiftool_on_copy(
-            filepath,
-            cmd_args,
-            timeout_error_msg="Timeout clearing metadata",
-            generic_error_prefix="Error clearing metadata",
-        )
+        No security probe is run: callers validate first, as with skip_security_check=True.
+        Results are (ok, error) per item, in input order.
+        """
+        results: List[Tuple[bool, str]] = [(True, "")] * len(items)
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for i, (filepath, updates, clear_fields) in enumerate(items):
+            if not os.path.exists(filepath):
+                results[i] = (False, "File not found")
+                continue
+            args = tuple(self._update_args(updates) + self._clear_args(clear_fields))
+            if args:
+                groups.setdefault(args, []).append(i)
+
+        for args, idxs in groups.items():
+            if len(idxs) == 1:
+                results[idxs[0]] = self._run_exiftool_on_copy(
+                    items[idxs[0]][0],
+                    list(args),
+                    timeout_error_msg="Timeout writing metadata",
+                    generic_error_prefix="Error writing metadata",
+                )
+                continue
+            outcomes = self._run_exiftool_on_copies([items[i][0] for i in idxs], list(args))
+            for i, outcome in zip(idxs, outcomes):
+                results[i] = outcome
+        return results
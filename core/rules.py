@@ -13,6 +13,12 @@ from datetime import datetime
 from typing import List, Tuple, Optional, Iterable  
 import unicodedata
 
+# Compiled once at import (shib token cleanup and filename validation)
+_WS_RE = re.compile(r"\s+")
+_SHIB_DISALLOWED_RE = re.compile(r"[^A-Za-z0-9.\-]+")
+_MULTI_HYPHEN_RE = re.compile(r"-{2,}")
+_DATE_PREFIX_RE = re.compile(r'^(\d{4})-(\d{2})(\d{2})')
+_BRACKET_BLOCKS_RE = re.compile(r'^([\{\[].*?[\}\]])+\s+')
 
 
 def make_shib_token_from_folder(foldername: str) -> str:
@@ -22,9 +28,9 @@ def make_shib_token_from_folder(foldername: str) -> str:
     s = unicodedata.normalize("NFKC", str(foldername)).strip()
     if not s:
         return ""
-    s = re.sub(r"\s+", "-", s)                # spaces -> hyphen
-    s = re.sub(r"[^A-Za-z0-9.\-]+", "", s)    # keep letters/digits/dot/hyphen
-    s = re.sub(r"-{2,}", "-", s)              # collapse hyphens
+    s = _WS_RE.sub("-", s)                    # spaces -> hyphen
+    s = _SHIB_DISALLOWED_RE.sub("", s)        # keep letters/digits/dot/hyphen
+    s = _MULTI_HYPHEN_RE.sub("-", s)          # collapse hyphens
     s = s.strip("-.")
     return f"shib-{s}" if s else ""
 
@@ -105,24 +111,24 @@ def process_keywords(keywords_input: str | List[str]) -> str:
 
     tokens = [t for t in raw if t]
 
-    # de-dup, case-insensitive; preserve first casing
+    # de-dup, case-insensitive; preserve first casing.
+    # The casefolded key also decides the tier, so each token is folded once.
     seen: set[str] = set()
-    uniq: List[str] = []
+    keyed: List[tuple] = []
     for t in tokens:
         k = t.casefold()
-        if k not in seen:
-            seen.add(k)
-            uniq.append(t)
-
-    def _tier_key(s: str):
-        sc = s.casefold()
-        if sc.startswith("shib-"):
+        if k in seen:
+            continue
+        seen.add(k)
+        if k.startswith("shib-"):
             # shib-1234 always last
-            return (2,) if sc == "shib-1234" else (1,) + tuple(natural_sort_key(s))
-        return (0,) + tuple(natural_sort_key(s))
+            tier = (2,) if k == "shib-1234" else (1,) + tuple(natural_sort_key(t))
+        else:
+            tier = (0,) + tuple(natural_sort_key(t))
+        keyed.append((tier, t))
 
-    uniq_sorted = sorted(uniq, key=_tier_key)
-    return ", ".join(uniq_sorted)
+    keyed.sort(key=lambda kt: kt[0])  # stable: equal keys keep first-seen order
+    return ", ".join(t for _tier, t in keyed)
 
 
 def is_leap_year(year: int) -> bool:
@@ -196,7 +202,7 @@ def validate_filename(filename: str) -> Optional[str]:
     # For validation only: if it ends with .pdf, strip extension
     name_part = filename[:-4] if filename.lower().endswith(".pdf") else filename
 
-    m = re.match(r'^(\d{4})-(\d{2})(\d{2})', name_part)
+    m = _DATE_PREFIX_RE.match(name_part)
     if not m:
         return "Expected YYYY-MMDD date."
 
@@ -207,7 +213,7 @@ def validate_filename(filename: str) -> Optional[str]:
 
     # Brackets must immediately follow the 10-char date prefix
     after_date = name_part[10:]
-    if not re.match(r'^([\{\[].*?[\}\]])+\s+', after_date):
+    if not _BRACKET_BLOCKS_RE.match(after_date):
         return "Expected {...} or [...] after date."
 
     return None
@@ -1,38 +1,92 @@
 # core/undo.py
 from __future__ import annotations
 
+import os
+import pickle
+import tempfile
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal, QThread
 
 from core.metadata import MetadataHandler
 
+JournalEntry = Tuple[str, Dict[str, str], Dict[str, str]]
+
+
+class Journal:
+    """
+    Append-only on-disk write journal: one pickled (filepath, old_values, new_values)
+    record per successful write, so a large batch is never held in memory as a list.
+    """
+
+    def __init__(self):
+        fd, self.path = tempfile.mkstemp(prefix="hspmeta_", suffix=".journal")
+        self._fh = os.fdopen(fd, "wb")
+        self.count = 0
+
+    def append(self, filepath: str, old_values: Dict[str, str], new_values: Dict[str, str]) -> None:
+        pickle.dump((filepath, old_values, new_values), self._fh, protocol=pickle.HIGHEST_PROTOCOL)
+        self.count += 1
+
+    def close(self) -> None:
+        self._fh.close()
+
+    @staticmethod
+    def iter(path: str) -> Iterator[JournalEntry]:
+        """Yield the records of a journal file in write order ("" or a missing file yields nothing)."""
+        if not path or not os.path.exists(path):
+            return
+        with open(path, "rb") as fh:
+            while True:
+                try:
+                    yield pickle.load(fh)
+                except EOFError:
+                    return
+
+    @staticmethod
+    def discard(path: str) -> None:
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
 
 @dataclass
 class UndoBatch:
     """
-    A single undo batch: list of (filepath, old_values, new_values).
+    A single undo batch: a Journal file of `count` (filepath, old_values, new_values) records.
     'old_values' are what we restore to; 'new_values' are informative only.
+    Iterating the batch streams the records from disk.
     """
-    changes: List[Tuple[str, Dict[str, str], Dict[str, str]]]
+    journal_path: str
+    count: int
+
+    def __iter__(self) -> Iterator[JournalEntry]:
+        return Journal.iter(self.journal_path)
 
 
 class UndoManager:
-    """Simple LIFO stack of UndoBatch objects."""
+    """Simple LIFO stack of UndoBatch objects; owns (and deletes) their journal files."""
     def __init__(self):
         self._stack: List[UndoBatch] = []
 
-    def push_batch(self, changes: List[Tuple[str, Dict[str, str], Dict[str, str]]]):
-        if changes:
-            self._stack.append(UndoBatch(changes=changes))
+    def push_batch(self, journal_path: str, count: int):
+        if journal_path and count:
+            self._stack.append(UndoBatch(journal_path=journal_path, count=count))
+        else:
+            Journal.discard(journal_path)
 
     def can_undo(self) -> bool:
         return len(self._stack) > 0
 
     def pop_last(self) -> UndoBatch | None:
+        """Remove the last batch once it has been undone; its journal file is deleted."""
         if not self._stack:
             return None
-        return self._stack.pop()
+        batch = self._stack.pop()
+        Journal.discard(batch.journal_path)
+        return batch
 
     def peek_last(self) -> UndoBatch | None:
         if not self._stack:
@@ -40,6 +94,8 @@ class UndoManager:
         return self._stack[-1]
 
     def clear(self):
+        for batch in self._stack:
+            Journal.discard(batch.journal_path)
         self._stack.clear()
 
 
@@ -77,14 +133,14 @@ class UndoWorker(QThread):
             self.error.emit(str(e))
             return
 
-        total = len(self._batch.changes)
+        total = self._batch.count
         done = 0
         successes = 0
         failures: List[dict] = []
 
         self.status.emit(f"Starting undo for {total} file(s)...")
 
-        for (path, old_values, _new_values) in self._batch.changes:
+        for (path, old_values, _new_values) in self._batch:
             if self._stop:
                 self.status.emit("Undo cancelled.")
                 self.cancelled.emit()
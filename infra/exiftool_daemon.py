@@ -0,0 +1,192 @@
+# infra/exiftool_daemon.py
+"""
+Persistent ExifTool processes (`exiftool -stay_open True -@ -`) shared by all handlers.
+
+Starting ExifTool (a Perl program) costs more than most single-file reads or writes,
+especially on Windows. A daemon keeps one process alive and streams argument lists to
+it over stdin: each command ends with a numbered -execute, stdout ends at the matching
+{readyN} line and stderr at an -echo4 marker that carries the command's exit status.
+
+A daemon runs one command at a time. run() checks an idle daemon out of a small
+per-executable pool (starting one when none is idle), so concurrent loader, reader
+and writer threads each get their own process instead of queueing on a single pipe.
+"""
+from __future__ import annotations
+
+import atexit
+import itertools
+import os
+import queue
+import subprocess
+import threading
+import time
+from typing import IO, Dict, List, Optional, Set, Tuple
+
+import logging
+logger = logging.getLogger("HSPMetaWizard.infra.exiftool_daemon")
+
+_SUBPROC_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == "nt" else 0
+
+# Idle daemons kept per ExifTool executable; extra ones are stopped when released.
+_MAX_IDLE = 8
+
+
+def _pump(pipe: IO[bytes], lines: "queue.Queue[Optional[bytes]]") -> None:
+    """Copy a pipe into a queue line by line; None marks EOF."""
+    try:
+        for line in iter(pipe.readline, b""):
+            lines.put(line)
+    except (OSError, ValueError):
+        pass
+    lines.put(None)
+
+
+class ExifToolDaemon:
+    """One `exiftool -stay_open True -@ -` process; execute() runs one argument list on it."""
+
+    def __init__(self, exiftool_path: str):
+        self.exiftool_path = exiftool_path
+        self.used = False
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+        self.proc = subprocess.Popen(
+            [exiftool_path, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            creationflags=_SUBPROC_FLAGS,
+        )
+        self._out: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._err: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        # Both pipes are drained on their own threads so a chatty stderr cannot stall stdout
+        for pipe, lines in ((self.proc.stdout, self._out), (self.proc.stderr, self._err)):
+            threading.Thread(target=_pump, args=(pipe, lines), daemon=True).start()
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def execute(self, args: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run one ExifTool command (arguments without the executable) and return a
+        CompletedProcess with text stdout/stderr and the command's exit status.
+        Raises subprocess.TimeoutExpired (the daemon is then stopped), OSError if the
+        process is gone, or ValueError for arguments an argfile cannot carry.
+        """
+        if any("\n" in a or "\r" in a for a in args):
+            raise ValueError("ExifTool argfile arguments cannot contain line breaks")
+
+        with self._lock:
+            n = next(self._seq)
+            lines = [*args, "-echo4", f"{{ready{n} ${{status}}}}", f"-execute{n}"]
+            try:
+                self.proc.stdin.write(("\n".join(lines) + "\n").encode("utf-8"))
+                self.proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                raise OSError(f"ExifTool daemon is not running: {e}") from e
+
+            deadline = time.monotonic() + timeout
+            out, _ = self._read_until(self._out, f"{{ready{n}}}", deadline, args, timeout)
+            err, marker = self._read_until(self._err, f"{{ready{n} ", deadline, args, timeout)
+            self.used = True
+
+        # "{readyN <status>}"; ExifTool versions without ${status} leave it unexpanded
+        try:
+            status = int(marker.strip()[len(f"{{ready{n} "):-1])
+        except ValueError:
+            status = 1 if "Error" in err else 0
+        return subprocess.CompletedProcess(args, status, stdout=out, stderr=err)
+
+    def _read_until(
+        self, lines: "queue.Queue[Optional[bytes]]", marker: str, deadline: float,
+        args: List[str], timeout: float,
+    ) -> Tuple[str, str]:
+        """Collect text up to the line starting with `marker`; returns (text, marker line)."""
+        chunks: List[str] = []
+        while True:
+            try:
+                raw = lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self.close(kill=True)
+                raise subprocess.TimeoutExpired(args, timeout) from None
+            if raw is None:
+                raise OSError("ExifTool daemon exited unexpectedly")
+            line = raw.decode("utf-8", errors="replace")
+            if line.startswith(marker):
+                return "".join(chunks), line
+            chunks.append(line)
+
+    def close(self, kill: bool = False) -> None:
+        if self.alive():
+            try:
+                if kill:
+                    raise OSError
+                self.proc.stdin.write(b"-stay_open\nFalse\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=2)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                self.proc.kill()
+        for pipe in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+            try:
+                pipe.close()
+            except (OSError, ValueError):
+                pass
+
+
+# ------------------------------- pool ---------------------------------------
+
+_pool_lock = threading.Lock()
+_idle: Dict[str, List[ExifToolDaemon]] = {}
+_unsupported: Set[str] = set()
+
+
+def available(exiftool_path: str) -> bool:
+    """False once a daemon for this executable failed its first command (e.g. not ExifTool)."""
+    return exiftool_path not in _unsupported
+
+
+def run(exiftool_path: str, args: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """Run one command on a pooled daemon for `exiftool_path` (see ExifToolDaemon.execute)."""
+    with _pool_lock:
+        idle = _idle.get(exiftool_path) or []
+        daemon = idle.pop() if idle else None
+    if daemon is not None and not daemon.alive():
+        daemon.close()
+        daemon = None
+    if daemon is None:
+        try:
+            daemon = ExifToolDaemon(exiftool_path)
+        except OSError:
+            _unsupported.add(exiftool_path)
+            raise
+
+    healthy = False
+    try:
+        result = daemon.execute(args, timeout)
+        healthy = True
+        return result
+    except OSError:
+        if not daemon.used:
+            logger.warning("ExifTool at %s does not support -stay_open; using one-off processes.", exiftool_path)
+            _unsupported.add(exiftool_path)
+        raise
+    except ValueError:
+        healthy = True  # nothing was sent; the daemon is still usable
+        raise
+    finally:
+        keep = False
+        if healthy and daemon.alive():
+            with _pool_lock:
+                idle = _idle.setdefault(exiftool_path, [])
+                if len(idle) < _MAX_IDLE:
+                    idle.append(daemon)
+                    keep = True
+        if not keep:
+            daemon.close()
+
+
+@atexit.register
+def shutdown() -> None:
+    """Stop every idle daemon (also runs at interpreter exit)."""
+    with _pool_lock:
+        daemons = [d for idle in _idle.values() for d in idle]
+        _idle.clear()
+    for daemon in daemons:
+        daemon.close()
@@ -3,7 +3,18 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _app_data_in_tmp(tmp_path_factory):
+    # Workers log under %LOCALAPPDATA%/HSPMetaWizard; keep that out of the repo when it is unset
+    mp = pytest.MonkeyPatch()
+    mp.setenv("LOCALAPPDATA", str(tmp_path_factory.mktemp("appdata")))
+    yield
+    mp.undo()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+from infra import exiftool_daemon
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake ExifTool is a shebang script")
+
+# Speaks the -stay_open protocol: echoes each command's arguments as JSON on stdout,
+# a warning on stderr, then the {readyN} / -echo4 markers. "fail" in a command sets status 1.
+_FAKE_EXIFTOOL = """\
+import json, sys
+args = []
+for line in sys.stdin:
+    line = line.rstrip("\\n")
+    if line == "False" and args[-1:] == ["-stay_open"]:
+        break
+    if not line.startswith("-execute"):
+        args.append(line)
+        continue
+    cut = args.index("-echo4")
+    sys.stdout.write(json.dumps(args[:cut]) + "\\n{ready%s}\\n" % line[len("-execute"):])
+    sys.stdout.flush()
+    status = "1" if "fail" in args else "0"
+    sys.stderr.write("Warning: fake\\n" + args[cut + 1].replace("${status}", status) + "\\n")
+    sys.stderr.flush()
+    args = []
+"""
+
+
+@pytest.fixture
+def fake_exiftool(tmp_path):
+    script = tmp_path / "exiftool"
+    script.write_text(f"#!{sys.executable}\n{_FAKE_EXIFTOOL}", encoding="utf-8")
+    script.chmod(0o755)
+    yield str(script)
+    exiftool_daemon.shutdown()
+
+
+def test_commands_reuse_one_pooled_process(fake_exiftool):
+    first = exiftool_daemon.run(fake_exiftool, ["-json", "/pdfs/ä.pdf"], timeout=10)
+    pid = exiftool_daemon._idle[fake_exiftool][0].proc.pid
+    second = exiftool_daemon.run(fake_exiftool, ["-Title=x", "fail"], timeout=10)
+
+    assert json.loads(first.stdout) == ["-json", "/pdfs/ä.pdf"]
+    assert (first.returncode, first.stderr) == (0, "Warning: fake\n")
+    assert second.returncode == 1
+    assert [d.proc.pid for d in exiftool_daemon._idle[fake_exiftool]] == [pid]
+
+
+def test_line_breaks_are_rejected_before_anything_is_sent(fake_exiftool):
+    with pytest.raises(ValueError):
+        exiftool_daemon.run(fake_exiftool, ["-Title=a\nb"], timeout=10)
+    assert exiftool_daemon.run(fake_exiftool, ["ok"], timeout=10).returncode == 0
+
+
+def test_executable_without_stay_open_is_marked_unavailable(tmp_path):
+    script = tmp_path / "not-exiftool"
+    script.write_text(f"#!{sys.executable}\nimport sys\nsys.exit(2)\n", encoding="utf-8")
+    script.chmod(0o755)
+
+    with pytest.raises(OSError):
+        exiftool_daemon.run(str(script), ["-json", "x.pdf"], timeout=10)
+    assert not exiftool_daemon.available(str(script))
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+
+from workers.loader import LoaderManager, LoaderWorker
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"%PDF-1.4\n")
+
+
+def test_iter_pdfs_finds_pdfs_recursively_and_flags_subfolders(tmp_path):
+    _touch(tmp_path / "top.pdf")
+    _touch(tmp_path / "UPPER.PDF")
+    _touch(tmp_path / "notes.txt")
+    _touch(tmp_path / "sub" / "nested.pdf")
+    _touch(tmp_path / "sub" / "deeper" / "deep.Pdf")
+    (tmp_path / "folder.pdf").mkdir()  # a directory named like a PDF is not a file
+
+    found = sorted(LoaderWorker(str(tmp_path))._iter_pdfs())
+
+    assert [(name, in_sub) for _path, name, in_sub in found] == [
+        ("UPPER.PDF", False),
+        ("deep.Pdf", True),
+        ("nested.pdf", True),
+        ("top.pdf", False),
+    ]
+    assert all(path.startswith(str(tmp_path)) for path, _n, _s in found)
+
+
+def test_iter_pdfs_collects_only_subfolders_holding_pdfs(tmp_path):
+    _touch(tmp_path / "top.pdf")
+    _touch(tmp_path / "sub" / "nested.pdf")
+    _touch(tmp_path / "sub" / "deeper" / "deep.pdf")
+    _touch(tmp_path / "empty" / "notes.txt")
+
+    worker = LoaderWorker(str(tmp_path))
+    list(worker._iter_pdfs())
+
+    assert sorted(worker._subfolders) == ["sub", os.path.join("sub", "deeper")]
+
+
+def test_iter_pdfs_keeps_subfolders_seen_before_a_listing_error(monkeypatch, tmp_path):
+    _touch(tmp_path / "sub" / "nested.pdf")
+    _touch(tmp_path / "top.pdf")
+    real_scandir = os.scandir
+
+    class _BrokenListing:
+        """Root listing that yields its subfolder, then fails (e.g. an entry vanished)."""
+        def __init__(self, path):
+            self._entries = [e for e in real_scandir(path) if e.is_dir()]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def __iter__(self):
+            yield from self._entries
+            raise PermissionError("listing interrupted")
+
+    monkeypatch.setattr(os, "scandir", lambda path: _BrokenListing(path) if path == str(tmp_path) else real_scandir(path))
+
+    found = list(LoaderWorker(str(tmp_path))._iter_pdfs())
+
+    assert [(name, in_sub) for _path, name, in_sub in found] == [("nested.pdf", True)]
+
+
+def test_iter_pdfs_missing_root_yields_nothing(tmp_path):
+    assert list(LoaderWorker(str(tmp_path / "missing"))._iter_pdfs()) == []
+
+
+def test_failed_chunk_read_becomes_error_rows_and_scan_completes(monkeypatch, tmp_path):
+    _touch(tmp_path / "a.pdf")
+    _touch(tmp_path / "b.pdf")
+
+    class _BrokenHandler:
+        def read_metadata_batch(self, paths):
+            raise OSError("exiftool crashed")
+
+    monkeypatch.setattr("workers.loader.MetadataHandler", _BrokenHandler)
+    worker = LoaderWorker(str(tmp_path))
+    completed, errors, statuses = [], [], []
+    worker.scan_complete.connect(completed.append)
+    worker.error.connect(errors.append)
+    worker.status.connect(statuses.append)
+    worker.run()
+
+    rows = completed[0]
+    assert sorted(r["filename"] for r in rows) == ["a.pdf", "b.pdf"]
+    assert all("exiftool crashed" in r["error_message"] and r["metadata_stale"] for r in rows)
+    assert errors == []
+    assert any("2 file(s)" in s for s in statuses)
+
+
+def test_loader_manager_counts_and_filters_streamed_rows():
+    mgr = LoaderManager()
+    rows = [
+        {"filename": "a.pdf", "is_protected": True},
+        {"filename": "b.pdf", "filename_warning": "Spaces in filename"},
+        {"filename": "c.pdf", "is_corrupted": True, "error_message": "bad xref"},
+        {"filename": "d.pdf"},
+    ]
+    mgr._on_files_found(rows[:2])
+    mgr._on_files_found(rows[2:])
+    mgr._on_scan_complete(list(rows))
+
+    assert mgr.get_statistics() == {"total": 4, "warnings": 1, "protected": 1}
+    assert [r["filename"] for r in mgr.get_files_by_status("protected")] == ["a.pdf"]
+    assert [r["filename"] for r in mgr.get_files_by_status("warning")] == ["b.pdf"]
+    assert [r["filename"] for r in mgr.get_files_by_status("error")] == ["c.pdf"]
+    assert mgr.get_files_by_status("other") == []
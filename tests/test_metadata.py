@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from core import metadata
+from core.metadata import MetadataHandler, PDFMetadata
+
+
+def _handler() -> MetadataHandler:
+    # Any existing executable passes the constructor's ExifTool check; runs are faked below
+    return MetadataHandler(exiftool_path=sys.executable, use_daemon=False)
+
+
+def test_read_metadata_batch_demultiplexes_one_exiftool_run(tmp_path, monkeypatch):
+    paths = [tmp_path / name for name in ("a.pdf", "locked.pdf", "broken.pdf", "skipped.pdf")]
+    for p in paths:
+        p.write_bytes(b"%PDF-1.4\n")
+    a, locked, broken, skipped = (str(p) for p in paths)
+
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        out = [
+            {"SourceFile": a, "PDF:Title": "Alpha", "PDF:Keywords": ["x", "y"]},
+            {"SourceFile": locked, "PDF:Encrypted": "yes"},
+            {"SourceFile": broken, "ExifTool:Error": "File format error"},
+            # skipped.pdf is missing from the output entirely
+        ]
+        return subprocess.CompletedProcess(cmd, 1, stdout=json.dumps(out), stderr="")
+
+    def fake_single(self, filepath):
+        md = PDFMetadata(filepath)
+        md.title = "single"
+        return md
+
+    monkeypatch.setattr(metadata.subprocess, "run", fake_run)
+    monkeypatch.setattr(MetadataHandler, "read_metadata", fake_single)
+
+    results = _handler().read_metadata_batch([a, locked, broken, skipped, str(tmp_path / "gone.pdf")])
+
+    assert len(calls) == 1 and "-@" in calls[0]
+    assert [md.filepath for md in results][:4] == [a, locked, broken, skipped]
+    assert (results[0].title, results[0].keywords) == ("Alpha", "x, y")
+    assert results[1].is_protected and not results[1].title
+    assert results[2].is_corrupted and "File format error" in results[2].error_message
+    assert results[3].title == "single"          # fell back to the per-file read
+    assert results[4].is_corrupted and results[4].error_message == "File not found"
+
+
+def test_read_metadata_batch_reads_a_repeated_path_once_and_fills_every_slot(tmp_path, monkeypatch):
+    a, b = str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")
+    for p in (a, b):
+        open(p, "wb").write(b"%PDF-1.4\n")
+
+    listed, singles = [], []
+
+    def fake_run(cmd, **kwargs):
+        with open(cmd[cmd.index("-@") + 1], encoding="utf-8") as f:
+            listed.extend(line.strip() for line in f if line.strip())
+        out = [{"SourceFile": a, "PDF:Title": "Alpha"}]   # b.pdf is missing from the output
+        return subprocess.CompletedProcess(cmd, 1, stdout=json.dumps(out), stderr="")
+
+    def fake_single(self, filepath):
+        singles.append(filepath)
+        md = PDFMetadata(filepath)
+        md.title = "single"
+        return md
+
+    monkeypatch.setattr(metadata.subprocess, "run", fake_run)
+    monkeypatch.setattr(MetadataHandler, "read_metadata", fake_single)
+
+    results = _handler().read_metadata_batch([a, b, a, b])
+
+    assert sorted(p for p in listed if p.endswith(".pdf")) == [a, b]
+    assert singles == [b]
+    assert [md.title for md in results] == ["Alpha", "single", "Alpha", "single"]
+
+
+def test_read_metadata_batch_falls_back_when_exiftool_output_is_unusable(tmp_path, monkeypatch):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+
+    monkeypatch.setattr(metadata.subprocess, "run",
+                        lambda cmd, **kw: subprocess.CompletedProcess(cmd, 0, stdout="not json", stderr=""))
+    monkeypatch.setattr(MetadataHandler, "read_metadata",
+                        lambda self, fp: PDFMetadata(fp))
+
+    [md] = _handler().read_metadata_batch([str(pdf)])
+    assert md.filepath == str(pdf) and not md.is_corrupted
+
+
+def test_write_metadata_batch_runs_exiftool_once_per_identical_edit(tmp_path, monkeypatch):
+    paths = []
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        p = tmp_path / name
+        p.write_bytes(b"%PDF-1.4\n")
+        paths.append(str(p))
+    a, b, c = paths
+
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(metadata.subprocess, "run", fake_run)
+
+    results = _handler().write_metadata_batch([
+        (a, {"author": "X"}, ["subject"]),
+        (str(tmp_path / "gone.pdf"), {"author": "X"}, ["subject"]),
+        (b, {"author": "X"}, ["subject"]),
+        (c, {"title": "Only C"}, []),
+    ])
+
+    assert results == [(True, ""), (False, "File not found"), (True, ""), (True, "")]
+    assert len(calls) == 2
+    assert "-@" in calls[0] and calls[0][-4:-2] == ["-Author=X", "-Subject="]
+    assert "-Title=Only C" in calls[1]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.pdf", "b.pdf", "c.pdf"]  # no temp leftovers
+
+
+def test_write_metadata_batch_retries_file_by_file_when_the_shared_run_fails(tmp_path, monkeypatch):
+    good, bad = tmp_path / "good.pdf", tmp_path / "bad.pdf"
+    good.write_bytes(b"%PDF-1.4\n")
+    bad.write_bytes(b"%PDF-bad\n")
+
+    def fake_run(cmd, **kwargs):
+        # The shared run fails; single-file runs (temp copy is the last arg) fail only for bad.pdf
+        failed = "-@" in cmd or open(cmd[-1], "rb").read() == b"%PDF-bad\n"
+        return subprocess.CompletedProcess(cmd, int(failed), stdout="", stderr="boom" if failed else "")
+
+    monkeypatch.setattr(metadata.subprocess, "run", fake_run)
+
+    results = _handler().write_metadata_batch([(str(good), {"author": "X"}, []), (str(bad), {"author": "X"}, [])])
+
+    assert results == [(True, ""), (False, "ExifTool error: boom")]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bad.pdf", "good.pdf"]
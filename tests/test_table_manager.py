@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from ui.constants import Col
+from ui.table_manager import FileTableManager
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def _row(name: str, **extra) -> dict:
+    data = {"filepath": f"/pdfs/{name}", "filename": name, "title": "", "author": "",
+            "subject": "", "keywords": ""}
+    data.update(extra)
+    return data
+
+
+def _manager_with(rows) -> FileTableManager:
+    tm = FileTableManager()
+    tm.begin_bulk_load()
+    for r in rows:
+        tm.add_file(r)
+    tm.end_bulk_load()
+    return tm
+
+
+def _selected_names(tm: FileTableManager) -> list:
+    return sorted(fd["filename"] for fd in tm.get_selected_files())
+
+
+def test_select_all_skips_locked_rows_and_invert_toggles(qapp):
+    tm = _manager_with([_row("a.pdf"), _row("b.pdf", is_protected=True), _row("c.pdf")])
+
+    tm.select_all()
+    assert _selected_names(tm) == ["a.pdf", "c.pdf"]
+    assert tm.get_counts() == {"total": 3, "selected": 2}
+
+    tm.table.item(0, int(Col.CHECK)).setCheckState(Qt.CheckState.Unchecked)
+    tm.invert_selection()
+    assert tm.selected_count() == 1
+
+    tm.select_none()
+    assert tm.get_selected_files() == []
+
+
+def test_checked_rows_follow_rows_through_a_sort(qapp):
+    tm = _manager_with([_row("c.pdf"), _row("a.pdf"), _row("b.pdf")])
+    row_of_c = tm.get_row_by_path("/pdfs/c.pdf")
+    tm.table.item(row_of_c, int(Col.CHECK)).setCheckState(Qt.CheckState.Checked)
+
+    tm.table.sortItems(int(Col.FILENAME), Qt.SortOrder.AscendingOrder)
+
+    assert tm.get_row_by_path("/pdfs/c.pdf") == 2
+    assert _selected_names(tm) == ["c.pdf"]
+
+
+def test_clear_resets_selection(qapp):
+    tm = _manager_with([_row("a.pdf")])
+    tm.select_all()
+    tm.clear()
+    assert tm.selected_count() == 0
+    assert tm.get_counts() == {"total": 0, "selected": 0}
+
+
+def test_update_row_metadata_by_path_targets_moved_rows(qapp):
+    tm = _manager_with([_row("b.pdf"), _row("a.pdf")])
+    tm.table.sortItems(int(Col.FILENAME), Qt.SortOrder.AscendingOrder)
+
+    assert tm.update_row_metadata_by_path("/pdfs/b.pdf", {"title": "Bee"})
+    row = tm.get_row_by_path("/pdfs/b.pdf")
+    assert tm.table.item(row, int(Col.TITLE)).text() == "Bee"
+    assert tm.get_row_by_path("/pdfs/missing.pdf") is None
+
+
+def test_batched_row_updates_keep_sorting_and_selection(qapp):
+    tm = _manager_with([_row("a.pdf"), _row("b.pdf"), _row("c.pdf")])
+    tm.table.sortItems(int(Col.FILENAME), Qt.SortOrder.AscendingOrder)
+    tm.table.item(tm.get_row_by_path("/pdfs/c.pdf"), int(Col.CHECK)).setCheckState(Qt.CheckState.Checked)
+
+    updated = tm.update_rows_metadata_by_path([
+        ("/pdfs/a.pdf", {"title": "Zulu"}),
+        ("/pdfs/c.pdf", {"title": "Alpha"}),
+        ("/pdfs/gone.pdf", {"title": "x"}),
+    ])
+
+    assert updated == 2
+    assert tm.table.isSortingEnabled() and tm.table.updatesEnabled()
+    assert not tm.table.signalsBlocked()
+    assert tm.table.item(tm.get_row_by_path("/pdfs/c.pdf"), int(Col.TITLE)).text() == "Alpha"
+    assert [fd["title"] for fd in tm.get_selected_files()] == ["Alpha"]
+
+
+def test_batched_updates_rebuild_the_path_index_at_most_once(qapp, monkeypatch):
+    tm = _manager_with([_row("b.pdf"), _row("a.pdf")])
+    tm.table.sortItems(int(Col.FILENAME), Qt.SortOrder.AscendingOrder)
+    rebuilds = []
+    rebuild = tm._rebuild_path_index
+    monkeypatch.setattr(tm, "_rebuild_path_index", lambda: (rebuilds.append(1), rebuild()))
+
+    updated = tm.update_rows_metadata_by_path(
+        [(f"/pdfs/gone{i}.pdf", {"title": "x"}) for i in range(5)] + [("/pdfs/b.pdf", {"title": "Bee"})])
+
+    assert updated == 1 and len(rebuilds) == 1
+    assert tm.table.item(tm.get_row_by_path("/pdfs/b.pdf"), int(Col.TITLE)).text() == "Bee"
+
+
+def test_rows_stay_stale_until_fresh_metadata_lands(qapp):
+    tm = _manager_with([_row("a.pdf"), _row("b.pdf")])
+    tm.select_all()
+
+    tm.mark_rows_stale(["/pdfs/a.pdf", "/pdfs/b.pdf", "/pdfs/gone.pdf"])
+    tm.update_rows_metadata_by_path([("/pdfs/b.pdf", {"title": "Fresh"})])
+
+    stale = {fd["filename"]: bool(fd.get("metadata_stale")) for fd in tm.get_selected_files()}
+    assert stale == {"a.pdf": True, "b.pdf": False}
+
+
+def test_get_all_paths_is_table_order_and_skips_pathless_rows(qapp):
+    tm = _manager_with([_row("b.pdf"), {"filename": "orphan.pdf"}, _row("a.pdf")])
+    assert tm.get_all_paths() == ["/pdfs/b.pdf", "/pdfs/a.pdf"]
+
+
+def test_select_all_skips_locked_rows_after_a_sort(qapp):
+    tm = _manager_with([_row("c.pdf"), _row("a.pdf", is_corrupted=True), _row("b.pdf")])
+    tm.table.sortItems(int(Col.FILENAME), Qt.SortOrder.AscendingOrder)
+
+    tm.select_all()
+    assert _selected_names(tm) == ["b.pdf", "c.pdf"]
+    tm.invert_selection()
+    assert tm.get_selected_files() == []
+
+
+def test_add_files_under_live_sorting_keeps_cells_together(qapp):
+    tm = FileTableManager()
+    tm.table.sortItems(int(Col.FILENAME), Qt.SortOrder.AscendingOrder)
+
+    tm.add_files([_row("c.pdf", title="C"), _row("a.pdf", title="A", is_protected=True), _row("b.pdf", title="B")])
+
+    titles = {tm.table.item(r, int(Col.FILENAME)).data(Qt.ItemDataRole.UserRole)["filename"]:
+              tm.table.item(r, int(Col.TITLE)).text() for r in range(tm.table.rowCount())}
+    assert titles == {"a.pdf": "A", "b.pdf": "B", "c.pdf": "C"}
+    tm.select_all()
+    assert _selected_names(tm) == ["b.pdf", "c.pdf"]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+
+from core.undo import Journal, UndoManager
+
+
+def test_journal_streams_records_back_in_write_order():
+    journal = Journal()
+    journal.append("/pdfs/a.pdf", {"title": "Old"}, {"title": "New"})
+    journal.append("/pdfs/b.pdf", {"author": ""}, {"author": "X"})
+    journal.close()
+
+    assert list(Journal.iter(journal.path)) == [
+        ("/pdfs/a.pdf", {"title": "Old"}, {"title": "New"}),
+        ("/pdfs/b.pdf", {"author": ""}, {"author": "X"}),
+    ]
+    Journal.discard(journal.path)
+    assert list(Journal.iter(journal.path)) == [] and list(Journal.iter("")) == []
+
+
+def test_undo_manager_owns_journal_files():
+    manager = UndoManager()
+    paths = []
+    for name in ("a", "b"):
+        journal = Journal()
+        journal.append(f"/pdfs/{name}.pdf", {"title": name}, {"title": name.upper()})
+        journal.close()
+        manager.push_batch(journal.path, journal.count)
+        paths.append(journal.path)
+
+    empty = Journal()
+    empty.close()
+    manager.push_batch(empty.path, 0)
+    assert not os.path.exists(empty.path)
+
+    batch = manager.peek_last()
+    assert batch.count == 1 and [entry[0] for entry in batch] == ["/pdfs/b.pdf"]
+    manager.pop_last()
+    assert not os.path.exists(paths[1]) and os.path.exists(paths[0])
+
+    manager.clear()
+    assert not manager.can_undo() and not os.path.exists(paths[0])
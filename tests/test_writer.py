@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from core.undo import Journal
+from workers.writer import WriterWorker, _merge_tokens
+
+
+def _current(**fields):
+    base = {"title": "", "author": "", "subject": "", "keywords": ""}
+    base.update(fields)
+    return SimpleNamespace(**base)
+
+
+def test_compute_updates_merges_appends_and_skips_clears():
+    worker = WriterWorker(
+        ["/pdfs/2024-0315 {AGM} Notes.pdf"],
+        updates={"Author": "bob; Carol", "Keywords": "b, shib-x", "Subject": "  "},
+        ops={"Author": "append", "Keywords": "APPEND", "Subject": "replace", "Title": "from_filename",
+             "Keywords2": "clear"},
+    )
+    current = _current(author="Alice | BOB", keywords="a, B")
+
+    updates = worker._compute_updates_for_file("/pdfs/2024-0315 {AGM} Notes.pdf", current)
+
+    assert updates == {
+        "author": "Alice, BOB, Carol",
+        "keywords": "a, B, shib-x",
+        "title": "2024-0315 {AGM} Notes",
+    }
+
+
+def test_merge_tokens_keeps_base_and_skips_case_insensitive_repeats():
+    assert _merge_tokens("Alice | BOB;;", "bob, Carol|alice ; Dave") == "Alice, BOB, Carol, Dave"
+    assert _merge_tokens("", " Eve ,") == "Eve"
+
+
+class _FakeHandler:
+    def __init__(self):
+        self.reads = []
+        self.writes = []
+        self.batches = []
+
+    def read_metadata(self, path):
+        self.reads.append(path)
+        return SimpleNamespace(title="", author="On disk", subject="", keywords="",
+                               is_protected=False, is_corrupted=False, error_message="")
+
+    def write_metadata_batch(self, items):
+        self.batches.append(len(items))
+        self.writes.extend((path, updates) for path, updates, _clears in items)
+        return [(True, "")] * len(items)
+
+
+def _run_writer(monkeypatch, files, updates=None, ops=None, **kwargs):
+    handler = _FakeHandler()
+    monkeypatch.setattr("workers.writer.MetadataHandler", lambda: handler)
+    updates = {"author": "Carol"} if updates is None else updates
+    ops = {"author": "append"} if ops is None else ops
+    worker = WriterWorker(files, updates=updates, ops=ops, **kwargs)
+    results = []
+    worker.finished.connect(lambda stats, failures, journal: results.append((stats, _read_journal(journal))))
+    worker.run()
+    return handler, results[0]
+
+
+def _scanned(pdf, fields):
+    """Row as the loader streams it: read values plus the file state they were read at."""
+    st = os.stat(pdf)
+    return {"filepath": str(pdf), "st_mtime_ns": st.st_mtime_ns, "st_size": st.st_size, **fields}
+
+
+def _read_journal(path):
+    entries = list(Journal.iter(path))
+    Journal.discard(path)
+    return entries
+
+
+def test_run_uses_scanned_row_metadata_unless_forced(monkeypatch, tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+    row = _scanned(pdf, {"title": "", "author": "Alice", "subject": "", "keywords": ""})
+
+    handler, (stats, journal) = _run_writer(monkeypatch, [row])
+    assert handler.reads == []
+    assert handler.writes == [(str(pdf), {"author": "Alice, Carol"})]
+    assert journal == [(str(pdf), {"author": "Alice"}, {"author": "Alice, Carol"})]
+
+    handler, (stats, _journal) = _run_writer(monkeypatch, [row], force_reread=True)
+    assert handler.reads == [str(pdf)]
+    assert handler.writes == [(str(pdf), {"author": "On disk, Carol"})]
+    assert stats["successes"] == 1
+
+
+def test_run_rereads_files_changed_after_the_scan(monkeypatch, tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+    row = _scanned(pdf, {"title": "", "author": "Alice", "subject": "", "keywords": ""})
+    # Another tool edits the file after the scan
+    pdf.write_bytes(b"%PDF-1.4\n% edited elsewhere\n")
+
+    handler, (_stats, journal) = _run_writer(monkeypatch, [row])
+    assert handler.reads == [str(pdf)]
+    assert handler.writes == [(str(pdf), {"author": "On disk, Carol"})]
+    assert journal == [(str(pdf), {"author": "On disk"}, {"author": "On disk, Carol"})]
+
+
+def test_run_rereads_rows_whose_refresh_has_not_landed(monkeypatch, tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+    row = _scanned(pdf, {"title": "", "author": "Alice", "subject": "", "keywords": "",
+           "metadata_stale": True})
+
+    handler, (_stats, _journal) = _run_writer(monkeypatch, [row])
+    assert handler.reads == [str(pdf)]
+    assert handler.writes == [(str(pdf), {"author": "On disk, Carol"})]
+
+
+def test_parallel_run_keeps_failures_in_input_order_and_journals_every_write(monkeypatch, tmp_path):
+    rows = []
+    for i in range(12):
+        pdf = tmp_path / f"{i:02d}.pdf"
+        pdf.write_bytes(b"%PDF-1.4\n")
+        rows.append(_scanned(pdf, {"title": "", "author": f"A{i}", "subject": "", "keywords": ""}))
+    rows.insert(5, {"filepath": str(tmp_path / "missing.pdf"), "title": ""})
+
+    handler = _FakeHandler()
+    monkeypatch.setattr("workers.writer.MetadataHandler", lambda: handler)
+    worker = WriterWorker(rows, updates={"author": "Z"}, ops={"author": "append"}, workers=4)
+    results = []
+    worker.finished.connect(lambda stats, failures, journal: results.append((stats, failures, _read_journal(journal))))
+    worker.run()
+
+    stats, failures, journal = results[0]
+    assert stats["successes"] == 12 and stats["failures"] == 1
+    assert [f["filename"] for f in failures] == ["missing.pdf"]
+    assert sorted(entry[2]["author"] for entry in journal) == sorted(f"A{i}, Z" for i in range(12))
+
+
+def test_identical_edits_are_written_in_shared_batches(monkeypatch, tmp_path):
+    rows = []
+    for i in range(10):
+        pdf = tmp_path / f"{i}.pdf"
+        pdf.write_bytes(b"%PDF-1.4\n")
+        rows.append(_scanned(pdf, {"title": "", "author": "", "subject": "", "keywords": ""}))
+
+    handler = _FakeHandler()
+    monkeypatch.setattr("workers.writer.MetadataHandler", lambda: handler)
+    worker = WriterWorker(rows, updates={"author": "Carol"}, ops={"author": "replace", "subject": "clear"},
+                          workers=2)
+    worker.finished.connect(lambda stats, failures, journal: _read_journal(journal))
+    worker.run()
+
+    assert sorted(handler.batches) == [5, 5]
+    assert sorted(handler.writes) == sorted((r["filepath"], {"author": "Carol"}) for r in rows)
+
+
+def test_run_without_any_effective_op_skips_every_file_untouched(monkeypatch, tmp_path):
+    handler = _FakeHandler()
+    monkeypatch.setattr("workers.writer.MetadataHandler", lambda: handler)
+    worker = WriterWorker([str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")],
+                          updates={"author": "  ", "title": "x"}, ops={"author": "append", "subject": "from_filename"})
+    results = []
+    worker.finished.connect(lambda stats, failures, journal: results.append((stats, failures, journal)))
+    worker.run()
+
+    stats, failures, journal = results[0]
+    assert (stats["skipped"], stats["successes"], failures, journal) == (2, 0, [], "")
+    assert handler.reads == [] and handler.batches == []
+
+
+def test_duplicate_paths_are_written_and_journaled_once(monkeypatch, tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+    row = _scanned(pdf, {"title": "", "author": "Alice", "subject": "", "keywords": ""})
+    again = dict(row, filepath=str(tmp_path / "." / "a.pdf"))
+
+    handler, (stats, journal) = _run_writer(monkeypatch, [row, again, str(pdf)])
+
+    assert handler.writes == [(str(pdf), {"author": "Alice, Carol"})]
+    assert len(journal) == 1
+    assert (stats["successes"], stats["skipped"]) == (1, 2)
+
+
+def test_plan_combines_derived_title_with_precomputed_clears(monkeypatch, tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+    row = _scanned(pdf, {"title": "Old", "author": "", "subject": "S", "keywords": ""})
+    worker = WriterWorker([row], updates={}, ops={"Title": "from_filename", "SUBJECT": "Clear"})
+
+    assert worker._clear_fields_l == ("subject",)
+    status, _name, _path, old, new, clears, _msg = worker._plan_one(None, row)
+    assert status == "write"
+    assert (old, new) == ({"title": "Old", "subject": "S"}, {"title": "a", "subject": ""})
+    assert clears == ["subject"]
+
+
+def test_empty_computed_value_is_skipped_not_cleared(monkeypatch, tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+    row = _scanned(pdf, {"title": "T", "author": "", "subject": "", "keywords": "k1"})
+
+    # process_keywords(",") == "": that is no value to write, not a request to clear Keywords
+    handler, (stats, journal) = _run_writer(
+        monkeypatch, [row], updates={"keywords": ","}, ops={"keywords": "replace"})
+
+    assert handler.batches == []
+    assert journal == []
+    assert (stats["successes"], stats["skipped"]) == (0, 1)
+
+
+def test_filename_stem_matches_pathlib():
+    for path in ("/pdfs/2024-0315 {AGM} Notes.pdf", "/pdfs/.hidden", "/pdfs/name.", "/pdfs/x.tar.gz",
+                 "noext", "/pdfs/b.c/d", ".pdf"):
+        assert WriterWorker._filename_stem(path) == Path(path).stem
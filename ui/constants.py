@@ -210,6 +210,20 @@ COL_INDEX = {
     "subject":  Col.SUBJECT,
 }
 
+# ===== Styles =====
+# Applied once on the main window; widgets opt in via setProperty("cssClass", ...).
+APP_STYLESHEET = """
+QLabel[cssClass="hint"]    { color: gray; font-size: 10pt; }
+QLabel[cssClass="muted"]   { color: gray; }
+QLabel[cssClass="note"]    { color: gray; font-size: 9pt; }
+QLabel[cssClass="heading"] { font-weight: bold; }
+QLabel[cssClass="warn"]    { color: orange; }
+QLabel[cssClass="prot"]    { color: red; }
+QLabel[cssClass="multi"]   { color: #b26a00; font-weight: bold; }
+QLabel[cssClass="status"]  { color: #666666; }
+QLabel[cssClass="error"]   { color: #aa3333; }
+"""
+
 # ===== Error Messages =====
 ERROR_FILE_NOT_FOUND = "File not found"
 ERROR_PROTECTED_SKIP = "Password protected (skipped)"
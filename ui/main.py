@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import sys
 import os
+import time
+from collections import deque
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Deque
 
-from PyQt6.QtCore import Qt, QUrl, QSettings   
+from PyQt6.QtCore import QUrl, QSettings, QSignalBlocker, QTimer, QThreadPool
 from PyQt6.QtWidgets import (                  
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLineEdit, QLabel, QGroupBox, QProgressBar,
@@ -33,10 +36,43 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from workers.loader import LoaderManager
 from workers.writer import WriterWorker
-from core.undo import UndoManager, UndoWorker
+from workers.reader import MetadataReadJob, ReadBatch, ReadSignals
+from core.undo import Journal, UndoManager, UndoWorker
 from core.metadata import MetadataHandler
 
 
+def _count_prefix(template: str) -> str:
+    """'Total: {}' -> 'Total: ' (count templates carry a single trailing placeholder)."""
+    prefix, placeholder, rest = template.partition("{}")
+    if not placeholder or rest:
+        raise ValueError(f"Count label template must end with '{{}}': {template!r}")
+    return prefix
+
+
+# Pre-split once so count refreshes are a concatenation, not a format parse
+_TOTAL_PREFIX = _count_prefix(LABEL_TOTAL)
+_SELECTED_PREFIX = _count_prefix(LABEL_SELECTED)
+_WARNINGS_PREFIX = _count_prefix(LABEL_WARNINGS)
+_PROTECTED_PREFIX = _count_prefix(LABEL_PROTECTED)
+
+# Messages kept for the Information dialog
+_INFO_LOG_LIMIT = 300
+
+# Minimum seconds between write/undo progress repaints (~30 Hz per-file label, ~100 Hz batch bar)
+_FILE_PROGRESS_INTERVAL = 0.033
+_BATCH_PROGRESS_INTERVAL = 0.010
+
+
+def set_css_class(widget: QWidget, css_class: str) -> None:
+    """Tag a widget for APP_STYLESHEET; re-polish only when the class actually changes."""
+    if widget.property("cssClass") == css_class:
+        return
+    widget.setProperty("cssClass", css_class)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -45,6 +81,7 @@ class MainWindow(QMainWindow):
         self.current_folder: str = ""
         self.pdf_files: List[dict] = []
         self.has_shown_subfolder_warning: bool = False
+        self._any_in_subfolder: bool = False  # any loaded PDF below the root folder
 
         # Managers
         self.table_manager = FileTableManager(self)
@@ -56,11 +93,41 @@ class MainWindow(QMainWindow):
         self.undo_thread: Optional[UndoWorker] = None
         self._active_undo_batch = None
 
+        # Post-write/undo row refreshes: independent reads run on a small pool
+        self._read_pool = QThreadPool(self)
+        self._read_pool.setMaxThreadCount(min(8, os.cpu_count() or 1))
+        self._read_signals = ReadSignals(self)
+        self._read_signals.batch_done.connect(self._on_rows_read)
+        self._row_reads_pending: int = 0
+        # ExifTool lookup happens once per session (see _get_handler)
+        self._metadata_handler: Optional[MetadataHandler] = None
+        self._handler_missing: bool = False
+
+        # Loader progress is coalesced to at most one widget update per frame
+        self._pending_progress: Optional[Tuple[int, int]] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_loader_progress)
+
+        # Write/undo progress is rate-limited; the latest skipped updates are kept and
+        # shown when the batch reaches its end or the run stops (see _flush_progress)
+        self._last_file_prog_ts: float = 0.0
+        self._last_batch_prog_ts: float = 0.0
+        self._pending_batch_progress: Optional[Tuple[int, int]] = None
+        self._pending_file_progress: Optional[Tuple[str, int, int, str]] = None
+
         # Info/errors buffers
-        self.info_messages: List[str] = []
+        # Bounded: the oldest messages fall off once the log is full
+        self.info_messages: Deque[str] = deque(maxlen=_INFO_LOG_LIMIT)
         self.last_failures: List[dict] = []
         self._panel_context_signature: tuple = ("none",)
         self.field_dirty: Dict[str, bool] = {}
+        self._metadata_panel_built: bool = False
+        self._count_values: Dict[str, int] = {}
+        # Last Clean/Sort Keywords input -> output; cleared whenever the panel context changes
+        self._last_kw_input: Optional[str] = None
+        self._last_kw_output: Optional[str] = None
+        self._confirm_boxes: Dict[Tuple[str, QMessageBox.Icon], QMessageBox] = {}
 
         # UI
         self.init_ui()
@@ -80,6 +147,7 @@ class MainWindow(QMainWindow):
     def init_ui(self):
         self.setWindowTitle(MAIN_WINDOW_TITLE)
         self.setGeometry(100, 100, 1200, 800)
+        self.setStyleSheet(APP_STYLESHEET)
 
         cw = QWidget(self)
         self.setCentralWidget(cw)
@@ -97,8 +165,10 @@ class MainWindow(QMainWindow):
         # File table
         main.addWidget(self.table_manager.table, stretch=1)
 
-        # Metadata edit panel
-        self.create_metadata_panel(main)
+        # Metadata edit panel: built on first use (see _ensure_metadata_panel)
+        self._main_layout = main
+        self._metadata_panel_placeholder = QWidget()
+        main.addWidget(self._metadata_panel_placeholder)
 
         # Progress + info/errors buttons
         self.create_progress_area(main)
@@ -149,7 +219,6 @@ class MainWindow(QMainWindow):
         row.addWidget(self.rescan_button)
 
         self.open_folder_button = QPushButton(BTN_OPEN_FOLDER) # Open folder button
-        self.open_folder_button.setToolTip(TIP_OPEN_FOLDER)
         self.open_folder_button.clicked.connect(self.open_current_folder)
         self.open_folder_button.setEnabled(False)
         row.addWidget(self.open_folder_button)
@@ -157,7 +226,7 @@ class MainWindow(QMainWindow):
         v.addLayout(row)
 
         hint = QLabel(TEXT_HINT)
-        hint.setStyleSheet("color: gray; font-size: 10pt;")
+        set_css_class(hint, "hint")
         v.addWidget(hint)
 
         return group
@@ -169,15 +238,15 @@ class MainWindow(QMainWindow):
         # Legend
         legend = QHBoxLayout()
         label_legend = QLabel(LABEL_LEGEND)
-        label_legend.setStyleSheet("font-weight: bold;")
+        set_css_class(label_legend, "heading")
         legend.addWidget(label_legend)
 
         warn = QLabel(f"{TEXT_FILENAME_WARNING} filename warning")
-        warn.setStyleSheet("color: orange;")
+        set_css_class(warn, "warn")
         legend.addWidget(warn)
 
         prot = QLabel(f"{TEXT_PROTECTED} protected (skipped)")
-        prot.setStyleSheet("color: red;")
+        set_css_class(prot, "prot")
         legend.addWidget(prot)
         legend.addStretch()
         v.addLayout(legend)
@@ -185,21 +254,25 @@ class MainWindow(QMainWindow):
         # Counts
         counts = QHBoxLayout()
         label_counts = QLabel(LABEL_COUNTS)
-        label_counts.setStyleSheet("font-weight: bold;")
+        set_css_class(label_counts, "heading")
         counts.addWidget(label_counts)
 
-        self.total_label = QLabel(LABEL_TOTAL.format(0))
+        self.total_label = QLabel()
+        self._set_count(self.total_label, _TOTAL_PREFIX, 0)
         counts.addWidget(self.total_label)
 
-        self.selected_label = QLabel(LABEL_SELECTED.format(0))
+        self.selected_label = QLabel()
+        self._set_count(self.selected_label, _SELECTED_PREFIX, 0)
         counts.addWidget(self.selected_label)
 
-        self.warnings_label = QLabel(LABEL_WARNINGS.format(0))
-        self.warnings_label.setStyleSheet("color: orange;")
+        self.warnings_label = QLabel()
+        self._set_count(self.warnings_label, _WARNINGS_PREFIX, 0)
+        set_css_class(self.warnings_label, "warn")
         counts.addWidget(self.warnings_label)
 
-        self.protected_label = QLabel(LABEL_PROTECTED.format(0))
-        self.protected_label.setStyleSheet("color: red;")
+        self.protected_label = QLabel()
+        self._set_count(self.protected_label, _PROTECTED_PREFIX, 0)
+        set_css_class(self.protected_label, "prot")
         counts.addWidget(self.protected_label)
 
         counts.addStretch()
@@ -224,17 +297,28 @@ class MainWindow(QMainWindow):
 
         return group
 
-    def create_metadata_panel(self, layout: QVBoxLayout):
+    def _ensure_metadata_panel(self):
+        """Build the metadata panel on first use and swap it in for the startup placeholder."""
+        if self._metadata_panel_built:
+            return
+        group = self.build_metadata_group()
+        self._main_layout.replaceWidget(self._metadata_panel_placeholder, group)
+        self._metadata_panel_placeholder.deleteLater()
+        self._metadata_panel_placeholder = None
+        self._metadata_panel_built = True
+        self.setup_metadata_panel_tooltips()
+
+    def build_metadata_group(self) -> QGroupBox:
         group = QGroupBox(GROUP_METADATA)
         g = QVBoxLayout(group)
 
         self.multi_select_label = QLabel("")
-        self.multi_select_label.setStyleSheet("color: #b26a00; font-weight: bold;")
+        set_css_class(self.multi_select_label, "multi")
         self.multi_select_label.setVisible(False)
         g.addWidget(self.multi_select_label)
 
         self.panel_status_label = QLabel(STATUS_NO_PREVIEW)
-        self.panel_status_label.setStyleSheet("color: #666666;")
+        set_css_class(self.panel_status_label, "status")
         self.panel_status_label.setWordWrap(True)
         g.addWidget(self.panel_status_label)
 
@@ -244,7 +328,7 @@ class MainWindow(QMainWindow):
         self.metadata_open_folder_button.clicked.connect(self.open_current_folder)
         row.addWidget(self.metadata_open_folder_button)
         hint = QLabel(MSG_RENAME_HINT)
-        hint.setStyleSheet("color: gray;")
+        set_css_class(hint, "muted")
         row.addWidget(hint, 1)
         g.addLayout(row)
 
@@ -256,11 +340,11 @@ class MainWindow(QMainWindow):
         row.addWidget(self.title_input, 1)
 
         self.title_update_button = QPushButton(BTN_UPDATE)
-        self.title_update_button.clicked.connect(lambda: self.on_update_field("title"))
+        self.title_update_button.clicked.connect(partial(self._apply_field_action, "update", "title"))
         row.addWidget(self.title_update_button)
 
         self.title_clear_button = QPushButton(BTN_CLEAR)
-        self.title_clear_button.clicked.connect(lambda: self.on_clear_field("title"))
+        self.title_clear_button.clicked.connect(partial(self._apply_field_action, "clear", "title"))
         row.addWidget(self.title_clear_button)
 
         self.copy_filename_all_button = QPushButton(BTN_COPY_FILENAME)
@@ -275,13 +359,13 @@ class MainWindow(QMainWindow):
         self.author_input.textEdited.connect(lambda _t: self._on_field_edited("author"))
         row.addWidget(self.author_input, 1)
         self.author_update_button = QPushButton(BTN_UPDATE)
-        self.author_update_button.clicked.connect(lambda: self.on_update_field("author"))
+        self.author_update_button.clicked.connect(partial(self._apply_field_action, "update", "author"))
         row.addWidget(self.author_update_button)
         self.author_add_button = QPushButton(BTN_ADD)
-        self.author_add_button.clicked.connect(lambda: self.on_add_field("author"))
+        self.author_add_button.clicked.connect(partial(self._apply_field_action, "add", "author"))
         row.addWidget(self.author_add_button)
         self.author_clear_button = QPushButton(BTN_CLEAR)
-        self.author_clear_button.clicked.connect(lambda: self.on_clear_field("author"))
+        self.author_clear_button.clicked.connect(partial(self._apply_field_action, "clear", "author"))
         row.addWidget(self.author_clear_button)
         g.addLayout(row)
 
@@ -292,13 +376,13 @@ class MainWindow(QMainWindow):
         self.subject_input.textEdited.connect(lambda _t: self._on_field_edited("subject"))
         row.addWidget(self.subject_input, 1)
         self.subject_update_button = QPushButton(BTN_UPDATE)
-        self.subject_update_button.clicked.connect(lambda: self.on_update_field("subject"))
+        self.subject_update_button.clicked.connect(partial(self._apply_field_action, "update", "subject"))
         row.addWidget(self.subject_update_button)
         self.subject_add_button = QPushButton(BTN_ADD)
-        self.subject_add_button.clicked.connect(lambda: self.on_add_field("subject"))
+        self.subject_add_button.clicked.connect(partial(self._apply_field_action, "add", "subject"))
         row.addWidget(self.subject_add_button)
         self.subject_clear_button = QPushButton(BTN_CLEAR)
-        self.subject_clear_button.clicked.connect(lambda: self.on_clear_field("subject"))
+        self.subject_clear_button.clicked.connect(partial(self._apply_field_action, "clear", "subject"))
         row.addWidget(self.subject_clear_button)
         g.addLayout(row)
 
@@ -309,13 +393,13 @@ class MainWindow(QMainWindow):
         self.keywords_input.textEdited.connect(lambda _t: self._on_field_edited("keywords"))
         row.addWidget(self.keywords_input, 1)
         self.keywords_update_button = QPushButton(BTN_UPDATE)
-        self.keywords_update_button.clicked.connect(lambda: self.on_update_field("keywords"))
+        self.keywords_update_button.clicked.connect(partial(self._apply_field_action, "update", "keywords"))
         row.addWidget(self.keywords_update_button)
         self.keywords_add_button = QPushButton(BTN_ADD)
-        self.keywords_add_button.clicked.connect(lambda: self.on_add_field("keywords"))
+        self.keywords_add_button.clicked.connect(partial(self._apply_field_action, "add", "keywords"))
         row.addWidget(self.keywords_add_button)
         self.keywords_clear_button = QPushButton(BTN_CLEAR)
-        self.keywords_clear_button.clicked.connect(lambda: self.on_clear_field("keywords"))
+        self.keywords_clear_button.clicked.connect(partial(self._apply_field_action, "clear", "keywords"))
         row.addWidget(self.keywords_clear_button)
         g.addLayout(row)
 
@@ -324,22 +408,18 @@ class MainWindow(QMainWindow):
         row.addWidget(QLabel(LABEL_KEYWORD_TOOLS))
 
         self.sort_keywords_button = QPushButton(BTN_SORT_KEYWORDS)
-        self.sort_keywords_button.setToolTip(TIP_SORT_KEYWORDS)
         self.sort_keywords_button.clicked.connect(self.clean_sort_keywords)
         row.addWidget(self.sort_keywords_button)
 
         self.ensure_folder_button = QPushButton(BTN_ADD_SHIB)
-        self.ensure_folder_button.setToolTip(TIP_ADD_SHIB)
         self.ensure_folder_button.clicked.connect(self.ensure_folder_shib)
         row.addWidget(self.ensure_folder_button)
 
         self.add_shib_1234_button = QPushButton(BTN_ADD_SHIB_1234)
-        self.add_shib_1234_button.setToolTip(TIP_ADD_SHIB_1234)
         self.add_shib_1234_button.clicked.connect(self.add_shib_1234)
         row.addWidget(self.add_shib_1234_button)
 
         self.undo_button = QPushButton(BTN_UNDO)
-        self.undo_button.setToolTip(TIP_UNDO)
         self.undo_button.clicked.connect(self.undo_last)
         self.undo_button.setEnabled(False)
         row.addWidget(self.undo_button)
@@ -348,7 +428,7 @@ class MainWindow(QMainWindow):
         g.addLayout(row)
 
         note = QLabel(TEXT_NOTE)
-        note.setStyleSheet("color: gray; font-size: 9pt;")
+        set_css_class(note, "note")
         note.setWordWrap(True)
         g.addWidget(note)
 
@@ -376,8 +456,14 @@ class MainWindow(QMainWindow):
             "keywords": self.keywords_clear_button,
         }
         self.field_dirty = {f: False for f in self.field_inputs}
+        # (field, input, update_btn, add_btn | None, clear_btn) - iterated on every state refresh
+        self._field_iter = tuple(
+            (f, self.field_inputs[f], self.field_update_buttons[f],
+             self.field_add_buttons.get(f), self.field_clear_buttons[f])
+            for f in METADATA_FIELDS
+        )
 
-        layout.addWidget(group)
+        return group
 
 
 
@@ -424,10 +510,13 @@ class MainWindow(QMainWindow):
         self.browse_button.setToolTip(TIP_BROWSE)
         self.rescan_button.setToolTip(TIP_RESCAN)
         self.folder_input.setToolTip(TIP_FOLDER_INPUT)
+        self.open_folder_button.setToolTip(TIP_OPEN_FOLDER)
         self.select_all_button.setToolTip(TIP_SELECT_ALL)
         self.select_none_button.setToolTip(TIP_SELECT_NONE)
         self.invert_button.setToolTip(TIP_INVERT)
+        self.cancel_button.setToolTip(TIP_CANCEL)
 
+    def setup_metadata_panel_tooltips(self):
         self.metadata_open_folder_button.setToolTip(TIP_OPEN_FOLDER)
         self.title_update_button.setToolTip(TIP_TITLE_UPDATE)
         self.title_clear_button.setToolTip(TIP_TITLE_CLEAR)
@@ -450,7 +539,6 @@ class MainWindow(QMainWindow):
         self.add_shib_1234_button.setToolTip(TIP_ADD_SHIB_1234)
 
         self.undo_button.setToolTip(TIP_UNDO)
-        self.cancel_button.setToolTip(TIP_CANCEL)
 
     def confirm_with_dont_ask(self, settings_key: str, title: str, text: str,
                             icon: QMessageBox.Icon = QMessageBox.Icon.Question) -> bool:
@@ -458,15 +546,10 @@ class MainWindow(QMainWindow):
         if self.settings.value(settings_key, False, bool):
             return True
 
-        box = QMessageBox(self)
-        box.setIcon(icon)
-        box.setWindowTitle(title)
+        box = self._get_confirm_box(title, icon)
         box.setText(text)
-        box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel)
-        box.setDefaultButton(QMessageBox.StandardButton.Yes)
-
-        cb = QCheckBox("Don’t ask me again")
-        box.setCheckBox(cb)
+        cb = box.checkBox()
+        cb.setChecked(False)
 
         result = box.exec()
         if result == QMessageBox.StandardButton.Yes:
@@ -475,36 +558,66 @@ class MainWindow(QMainWindow):
             return True
         return False
     
+    def _get_confirm_box(self, title: str, icon: QMessageBox.Icon) -> QMessageBox:
+        """One reusable Yes/Cancel box (with 'Don't ask' checkbox) per title/icon; callers set the text."""
+        key = (title, icon)
+        box = self._confirm_boxes.get(key)
+        if box is None:
+            box = QMessageBox(self)
+            box.setIcon(icon)
+            box.setWindowTitle(title)
+            box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Cancel)
+            box.setDefaultButton(QMessageBox.StandardButton.Yes)
+            box.setCheckBox(QCheckBox("Don’t ask me again", box))  # parented: the box keeps it alive
+            self._confirm_boxes[key] = box
+        return box
+
     # -------------------- Loader integration --------------------
 
     def connect_loader_signals(self):
         self.loader_manager.progress.connect(self.on_loader_progress)
         self.loader_manager.status.connect(self.add_info)
-        self.loader_manager.file_found.connect(self.add_file_to_table)
+        self.loader_manager.files_found.connect(self.add_files_to_table)
         self.loader_manager.scan_complete.connect(self.on_scan_complete)
         self.loader_manager.error.connect(self.on_loader_error)
         self.loader_manager.subfolder_warning.connect(self.on_subfolder_warning)
 
     def on_loader_progress(self, current: int, total: int):
+        self._pending_progress = (current, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_loader_progress(self):
+        pending = self._pending_progress
+        self._pending_progress = None
+        if pending is None:
+            self._progress_timer.stop()
+            return
+        current, total = pending
         self.batch_progress.setMaximum(total)
         self.batch_progress.setValue(current)
         pct = int((current / total) * 100) if total else 0
         self.file_status_label.setText(STATUS_SCANNING.format(current, total, pct))
 
-    def add_file_to_table(self, file_data: dict):
-        self.table_manager.add_file(file_data)
-        self.pdf_files.append(file_data)
+    def add_files_to_table(self, rows: List[dict]):
+        self.table_manager.add_files(rows)
+        self.pdf_files.extend(rows)
+        if not self._any_in_subfolder:
+            self._any_in_subfolder = any(fd.get("in_subfolder") for fd in rows)
 
     def on_scan_complete(self, files: list):
+        self._flush_loader_progress()
+        self._progress_timer.stop()
         self.table_manager.end_bulk_load()
         self.pdf_files = files
+        self._any_in_subfolder = any(fd.get("in_subfolder") for fd in files)
         self.cancel_button.setEnabled(False)
         self.batch_progress.setValue(self.batch_progress.maximum())
 
         stats = self.loader_manager.get_statistics()
-        self.total_label.setText(LABEL_TOTAL.format(stats["total"]))
-        self.warnings_label.setText(LABEL_WARNINGS.format(stats["warnings"]))
-        self.protected_label.setText(LABEL_PROTECTED.format(stats["protected"]))
+        self._set_count(self.total_label, _TOTAL_PREFIX, stats["total"])
+        self._set_count(self.warnings_label, _WARNINGS_PREFIX, stats["warnings"])
+        self._set_count(self.protected_label, _PROTECTED_PREFIX, stats["protected"])
 
         if stats["total"] == 0:
             self.add_info(STATUS_NO_PDFS)
@@ -523,6 +636,8 @@ class MainWindow(QMainWindow):
         self.update_ui_state()
 
     def on_loader_error(self, error_msg: str):
+        self._flush_loader_progress()
+        self._progress_timer.stop()
         self.table_manager.end_bulk_load()
         QMessageBox.critical(self, DIALOG_ERROR, error_msg)
         self.cancel_button.setEnabled(False)
@@ -571,10 +686,12 @@ class MainWindow(QMainWindow):
         self.table_manager.begin_bulk_load()
         self.table_manager.clear() # Clear the table
         self.pdf_files.clear() # Clear the internal file list
+        self._any_in_subfolder = False
         self.info_messages.clear() # Clear previous info messages
         self.undo_manager.clear()  # Undo history is folder-scoped; clear on new load
 
         self.add_info(STATUS_LOADING_FOLDER.format(folder)) # Reset progress
+        self._pending_progress = None # Drop progress still queued from a previous scan
         self.cancel_button.setEnabled(True) # Start cancel button
         self.batch_progress.setValue(0) # Reset batch progress
         self.file_progress.setValue(0) # Reset file progress
@@ -596,22 +713,26 @@ class MainWindow(QMainWindow):
         if self.info_messages and self.info_messages[-1] == message:
             return
         self.info_messages.append(message)
-        # Bound memory
-        if len(self.info_messages) > 300:
-            del self.info_messages[:50]
 
     def show_information(self):
-        InfoDialog(self.info_messages, self).exec()
+        InfoDialog(list(self.info_messages), self).exec()
+
+    def _set_count(self, label: QLabel, prefix: str, value: int):
+        """Set a count label, skipping the Qt text update when the number is unchanged."""
+        if self._count_values.get(prefix) == value:
+            return
+        self._count_values[prefix] = value
+        label.setText(prefix + str(value))
 
     def update_counts(self):
         counts = self.table_manager.get_counts()
-        self.total_label.setText(LABEL_TOTAL.format(counts["total"]))
-        self.selected_label.setText(LABEL_SELECTED.format(counts["selected"]))
+        self._set_count(self.total_label, _TOTAL_PREFIX, counts["total"])
+        self._set_count(self.selected_label, _SELECTED_PREFIX, counts["selected"])
 
-        if getattr(self.loader_manager, "loaded_files", None):
+        if self.loader_manager.has_stats:
             stats = self.loader_manager.get_statistics()
-            self.warnings_label.setText(LABEL_WARNINGS.format(stats["warnings"]))
-            self.protected_label.setText(LABEL_PROTECTED.format(stats["protected"]))
+            self._set_count(self.warnings_label, _WARNINGS_PREFIX, stats["warnings"])
+            self._set_count(self.protected_label, _PROTECTED_PREFIX, stats["protected"])
         self._refresh_metadata_panel()
         self.update_ui_state()
 
@@ -621,27 +742,33 @@ class MainWindow(QMainWindow):
         writer_active = bool(self.writer_thread and self.writer_thread.isRunning())
         undo_active = bool(self.undo_thread and self.undo_thread.isRunning())
         busy = loader_active or writer_active or undo_active
-        checked_files = self.get_selected_files()
-        has_checked = bool(checked_files)
-        blocked, _msg = self._selection_has_blockers(checked_files)
-        can_modify_checked = has_checked and (not blocked) and (not busy)
 
         self.select_all_button.setEnabled(has_files and not busy)
         self.select_none_button.setEnabled(has_files and not busy)
         self.invert_button.setEnabled(has_files and not busy)
-        self.undo_button.setEnabled(self.undo_manager.can_undo() and not busy)
         self.cancel_button.setEnabled(busy)
 
         self.open_folder_button.setEnabled(bool((self.folder_input.text() or "").strip() and os.path.isdir((self.folder_input.text() or "").strip())))
+        if not self._metadata_panel_built:
+            return
+
+        # Rows still being re-read after a write/undo: hold off further edits, not Cancel.
+        busy = busy or self._row_reads_pending > 0
+        checked_files = self.get_selected_files()
+        has_checked = bool(checked_files)
+        blocked, _msg = self._selection_has_blockers(checked_files)
+        can_modify_checked = has_checked and (not blocked) and (not busy)
+
+        self.undo_button.setEnabled(self.undo_manager.can_undo() and not busy)
         self.metadata_open_folder_button.setEnabled(self.open_folder_button.isEnabled())
 
         # Field actions: only checked rows are actionable.
-        for field, button in self.field_update_buttons.items():
-            button.setEnabled(can_modify_checked and self.field_dirty.get(field, False))
-        for field, button in self.field_add_buttons.items():
-            button.setEnabled(can_modify_checked and self.field_dirty.get(field, False))
-        for _field, button in self.field_clear_buttons.items():
-            button.setEnabled(can_modify_checked)
+        for field, _line, update_btn, add_btn, clear_btn in self._field_iter:
+            dirty = can_modify_checked and self.field_dirty.get(field, False)
+            update_btn.setEnabled(dirty)
+            if add_btn is not None:
+                add_btn.setEnabled(dirty)
+            clear_btn.setEnabled(can_modify_checked)
 
         self.copy_filename_all_button.setEnabled(can_modify_checked)
         self.sort_keywords_button.setEnabled((not busy) and bool((self.keywords_input.text() or "").strip()))
@@ -677,12 +804,19 @@ class MainWindow(QMainWindow):
         preview_path = (preview or {}).get("filepath") or (preview or {}).get("path") or ""
         signature = ("checked", checked_paths) if checked else ("preview", preview_path) if preview else ("none",)
 
+        if not self._metadata_panel_built:
+            if signature == ("none",):
+                return
+            self._ensure_metadata_panel()
+            force = True
+
         if not force and signature == self._panel_context_signature:
             self._set_panel_status_labels(checked, preview)
             return
 
         self._panel_context_signature = signature
         self._reset_field_dirty_flags()
+        self._last_kw_input = self._last_kw_output = None
 
         if checked:
             self._populate_inputs_from_files(checked)
@@ -690,28 +824,28 @@ class MainWindow(QMainWindow):
             self._populate_inputs_from_files([preview])
         else:
             for field, line in self.field_inputs.items():
-                line.setText("")
-                line.setPlaceholderText("")
+                self._set_input_silently(line, "", "")
                 self.field_dirty[field] = False
 
         self._set_panel_status_labels(checked, preview)
         self.update_ui_state()
 
     def _populate_inputs_from_files(self, files: List[Dict]):
-        for field, line in self.field_inputs.items():
+        for field, line, _update_btn, _add_btn, _clear_btn in self._field_iter:
             values = [str((fd.get(field) or "")).strip() for fd in files]
-            if len(files) == 1:
-                line.setText(values[0])
-                line.setPlaceholderText("")
-                continue
-
-            uniq = {v for v in values}
-            if len(uniq) == 1:
-                line.setText(values[0] if values else "")
-                line.setPlaceholderText("")
+            if len(files) == 1 or len(set(values)) == 1:
+                self._set_input_silently(line, values[0] if values else "", "")
             else:
-                line.setText("")
-                line.setPlaceholderText(MSG_MULTIPLE_VALUES)
+                self._set_input_silently(line, "", MSG_MULTIPLE_VALUES)
+        # Programmatic fills are never user edits
+        self._reset_field_dirty_flags()
+
+    @staticmethod
+    def _set_input_silently(line: QLineEdit, text: str, placeholder: str):
+        """Fill a panel input without emitting text signals back into the edit handlers."""
+        with QSignalBlocker(line):
+            line.setText(text)
+            line.setPlaceholderText(placeholder)
 
     def _set_panel_status_labels(self, checked: List[Dict], preview: Optional[Dict]):
         checked_count = len(checked)
@@ -722,7 +856,7 @@ class MainWindow(QMainWindow):
             blocked, message = self._selection_has_blockers(checked)
             if blocked:
                 self.panel_status_label.setText(message)
-                self.panel_status_label.setStyleSheet("color: #aa3333;")
+                set_css_class(self.panel_status_label, "error")
             else:
                 self.panel_status_label.setText("")
             return
@@ -731,20 +865,20 @@ class MainWindow(QMainWindow):
             locked_preview = bool(preview.get("is_protected") or preview.get("is_corrupted") or preview.get("error_message"))
             if locked_preview:
                 self.panel_status_label.setText(STATUS_PREVIEW_LOCKED)
-                self.panel_status_label.setStyleSheet("color: #aa3333;")
+                set_css_class(self.panel_status_label, "error")
             else:
                 self.panel_status_label.setText(STATUS_PREVIEW_ONLY)
-                self.panel_status_label.setStyleSheet("color: #666666;")
+                set_css_class(self.panel_status_label, "status")
             return
 
         self.panel_status_label.setText(STATUS_NO_PREVIEW)
-        self.panel_status_label.setStyleSheet("color: #666666;")
+        set_css_class(self.panel_status_label, "status")
 
     def _on_source_text_changed(self, text: str):
         path = (text or "").strip()
         enabled = bool(path and os.path.isdir(path))
         self.open_folder_button.setEnabled(enabled)
-        if hasattr(self, "metadata_open_folder_button"):
+        if self._metadata_panel_built:
             self.metadata_open_folder_button.setEnabled(enabled)
 
     def open_current_folder(self):
@@ -763,7 +897,12 @@ class MainWindow(QMainWindow):
         text = (self.keywords_input.text() or "").strip()
         if not text:
             return
-        normalized = self._normalize_keywords_or_warn(text)
+        # Normalization is idempotent, so both the last input and its output map to the cached result
+        if text == self._last_kw_input or text == self._last_kw_output:
+            normalized = self._last_kw_output
+        else:
+            normalized = self._normalize_keywords_or_warn(text)
+            self._last_kw_input, self._last_kw_output = text, normalized
         self.keywords_input.setText(normalized)
         if normalized != text:
             self._on_field_edited("keywords")
@@ -840,22 +979,26 @@ class MainWindow(QMainWindow):
             # Log to the info panel; keep the UI responsive
             self.add_info(f"Keyword normalization failed: {e!r}")
 
-            # Fallback: split, trim, dedupe (case-insensitive), sort; put shib-* at the end
+            # Fallback: split, trim, dedupe (case-insensitive), sort; put shib-* at the end.
+            # One pass: the casefolded key serves both the dedupe and the shib check.
             try:
-                parts = [p.strip() for p in (text or "").split(",")]
-                parts = [p for p in parts if p]
                 seen = set()
-                dedup = []
-                for p in parts:
+                shib: List[str] = []
+                rest: List[str] = []
+                for raw in (text or "").split(","):
+                    p = raw.strip()
+                    if not p:
+                        continue
                     k = p.casefold()
-                    if k not in seen:
-                        seen.add(k)
-                        dedup.append(p)
-                shib = [p for p in dedup if p.lower().startswith("shib-")]
-                rest = [p for p in dedup if not p.lower().startswith("shib-")]
+                    if k in seen:
+                        continue
+                    seen.add(k)
+                    (shib if k.startswith("shib-") else rest).append(p)
                 rest.sort(key=str.casefold)
                 shib.sort(key=str.casefold)
-                return ", ".join(rest + shib)
+                if shib:
+                    rest.extend(shib)
+                return ", ".join(rest)
             except Exception:
                 QMessageBox.critical(self, DIALOG_ERROR, "Failed to normalize keywords; keeping original text.")
                 return text
@@ -866,8 +1009,7 @@ class MainWindow(QMainWindow):
     def _maybe_show_subfolder_warning_once(self) -> bool:
         if self.has_shown_subfolder_warning:
             return True
-        any_sub = any(fd.get("in_subfolder") for fd in self.pdf_files)
-        if not any_sub:
+        if not self._any_in_subfolder:
             return True
         reply = QMessageBox.warning(
             self, "Subfolder Warning",
@@ -902,7 +1044,22 @@ class MainWindow(QMainWindow):
             icon=icon,
         )
 
+    def _apply_field_action(self, kind: str, field: str):
+        """Single slot behind every per-field Update/Add/Clear button."""
+        if kind == "update":
+            self.on_update_field(field)
+        elif kind == "add":
+            self.on_add_field(field)
+        elif kind == "clear":
+            self.on_clear_field(field)
+
     def on_update_field(self, field: str):
+        # Empty input is ignored silently - check it before touching the selection
+        line: QLineEdit = self.field_inputs[field]
+        text = (line.text() or "").strip()
+        if not text:
+            return
+
         files = self.get_selected_files()
         if not files:
             return
@@ -911,11 +1068,6 @@ class MainWindow(QMainWindow):
             self.update_ui_state()
             return
 
-        line: QLineEdit = self.field_inputs[field]
-        text = (line.text() or "").strip()
-        if not text:
-            return  # ignore empty input silently
-
         if not self._confirm_multi_field_action("update", field, len(files)):
             return
 
@@ -941,6 +1093,10 @@ class MainWindow(QMainWindow):
         self._start_writer_with_progress(len(files), STATUS_WRITE_START)
 
     def on_add_field(self, field: str):
+        line: QLineEdit = self.field_inputs[field]
+        text = (line.text() or "").strip()
+        if not text:
+            return  # ignore empty input silently
         files = self.get_selected_files()
         if not files:
             return
@@ -948,10 +1104,6 @@ class MainWindow(QMainWindow):
         if blocked:
             self.update_ui_state()
             return
-        line: QLineEdit = self.field_inputs[field]
-        text = (line.text() or "").strip()
-        if not text:
-            return  # ignore empty input silently
         if not self._confirm_multi_field_action("add", field, len(files)):
             return
         self.writer_thread = append_field(files, field, text, self)
@@ -1001,32 +1153,76 @@ class MainWindow(QMainWindow):
         self.file_progress.setMaximum(100)
         self.file_progress.setValue(0)
         self.file_status_label.setText("")
+        self._reset_progress_throttle()
         self.add_info(start_message)
         self.update_ui_state()
         self.writer_thread.start()
 
     def _on_write_progress(self, current: int, total: int):
+        self._apply_batch_progress(current, total)
+
+    def _on_write_file_progress(self, done: int, total: int, filename: str):
+        self._apply_file_progress(STATUS_WRITE_FILE, done, total, filename)
+
+    def _reset_progress_throttle(self):
+        self._pending_batch_progress = self._pending_file_progress = None
+        self._last_file_prog_ts = self._last_batch_prog_ts = 0.0
+
+    def _flush_progress(self):
+        """Show any throttled batch/file progress (a run can end before its final update)."""
+        if self._pending_batch_progress is not None:
+            self._show_batch_progress(*self._pending_batch_progress)
+        if self._pending_file_progress is not None:
+            self._show_file_progress(*self._pending_file_progress)
+
+    def _apply_batch_progress(self, current: int, total: int):
+        """Batch bar update, skipped if the last one was under _BATCH_PROGRESS_INTERVAL ago (except at the end)."""
+        final = current >= total
+        now = time.perf_counter()
+        if not final and now - self._last_batch_prog_ts < _BATCH_PROGRESS_INTERVAL:
+            self._pending_batch_progress = (current, total)
+            return
+        self._last_batch_prog_ts = now
+        self._show_batch_progress(current, total)
+        if final:
+            self._flush_progress()
+
+    def _show_batch_progress(self, current: int, total: int):
+        self._pending_batch_progress = None
         self.batch_progress.setMaximum(total)
         self.batch_progress.setValue(current)
 
-    def _on_write_file_progress(self, done: int, total: int, filename: str):
+    def _apply_file_progress(self, template: str, done: int, total: int, filename: str):
+        """Per-file bar + label, at most every _FILE_PROGRESS_INTERVAL; the latest skipped state is kept."""
+        now = time.perf_counter()
+        if now - self._last_file_prog_ts < _FILE_PROGRESS_INTERVAL:
+            self._pending_file_progress = (template, done, total, filename)
+            return
+        self._last_file_prog_ts = now
+        self._show_file_progress(template, done, total, filename)
+
+    def _show_file_progress(self, template: str, done: int, total: int, filename: str):
+        self._pending_file_progress = None
         pct = int((done / total) * 100) if total else 0
         self.file_progress.setValue(pct)
-        self.file_status_label.setText(STATUS_WRITE_FILE.format(done, total, filename))
+        self.file_status_label.setText(template.format(done, total, filename))
 
     def _on_write_error(self, msg: str):
+        self._flush_progress()
         QMessageBox.critical(self, DIALOG_WRITE_ERROR, msg)
         self.add_info(f"{DIALOG_WRITE_ERROR}: {msg}")
         self.writer_thread = None
         self.update_ui_state()
 
     def _on_write_cancelled(self):
+        self._flush_progress()
         self.add_info(STATUS_WRITE_CANCELLED)
         self.writer_thread = None
         self.update_ui_state()
 
-    def _on_write_finished(self, stats: dict, failures: List[dict], journal: List):
-        self.undo_manager.push_batch(journal)
+    def _on_write_finished(self, stats: dict, failures: List[dict], journal_path: str):
+        self._flush_progress()
+        self.undo_manager.push_batch(journal_path, stats.get("successes", 0))
         if stats.get("cancelled"):
             self.add_info(STATUS_WRITE_CANCELLED)
             self.add_info(STATUS_WRITE_PARTIAL.format(
@@ -1043,46 +1239,64 @@ class MainWindow(QMainWindow):
         self.last_failures = failures[:]  # remember for later
         if failures:
             self.show_errors_dialog(failures)  # auto-open on errors
-        self._refresh_rows_after_write(journal)
-        self._refresh_metadata_panel(force=True)
         self.writer_thread = None
+        self._refresh_rows_after_write(journal_path)
         self.update_ui_state()
-        self.undo_button.setEnabled(self.undo_manager.can_undo())
-
-    def _refresh_rows_after_write(self, journal: Optional[List] = None):
-        try:
-            handler = MetadataHandler()
-        except FileNotFoundError:
-            return
-
-        paths: List[str] = []
-        seen = set()
+        self.undo_button.setEnabled(self.undo_manager.can_undo() and not self._row_reads_pending)
 
+    def _refresh_rows_after_write(self, journal_path: str = ""):
         # Prefer exact file list from successful writes for consistency under active UI changes.
-        for entry in (journal or []):
-            if not isinstance(entry, (list, tuple)) or not entry:
-                continue
-            path = str(entry[0] or "")
-            if path and path not in seen:
-                seen.add(path)
-                paths.append(path)
+        # dict.fromkeys dedupes in one pass and keeps first-seen order.
+        paths: List[str] = list(dict.fromkeys(
+            str(entry[0]) for entry in Journal.iter(journal_path) if entry and entry[0]
+        ))
 
         # Fallback for legacy/no-journal cases.
         if not paths:
-            for fd in self.get_selected_files():
-                path = fd.get("filepath") or fd.get("path")
-                if path and path not in seen:
-                    seen.add(path)
-                    paths.append(path)
+            paths = [p for p in dict.fromkeys(
+                fd.get("filepath") or fd.get("path") for fd in self.get_selected_files()
+            ) if p]
+
+        self._read_rows_async(paths)
 
+    def _read_rows_async(self, paths: List[str]):
+        """
+        Re-read metadata for `paths` on the read pool. The jobs pool their results in a
+        ReadBatch, which posts them back once; they are applied in one table batch.
+        Rows stay marked stale until their read lands, so a failed or skipped refresh
+        never leaves cached values for the next write to build on.
+        """
+        self.table_manager.mark_rows_stale(paths)
+        handler = self._get_handler()
+        if handler is None:
+            paths = []
+        if not paths:
+            self._on_row_reads_done()
+            return
+        self._row_reads_pending += len(paths)
+        batch = ReadBatch(len(paths), self._read_signals)
         for path in paths:
-            meta = handler.read_metadata(path)
-            self.table_manager.update_row_metadata_by_path(path, {
-                "title": meta.title or "",
-                "author": meta.author or "",
-                "subject": meta.subject or "",
-                "keywords": meta.keywords or "",
-            })
+            self._read_pool.start(MetadataReadJob(path, batch, handler))
+
+    def _get_handler(self) -> Optional[MetadataHandler]:
+        """Shared MetadataHandler, or None when ExifTool is unavailable (remembered, not re-probed)."""
+        if self._metadata_handler is None and not self._handler_missing:
+            try:
+                self._metadata_handler = MetadataHandler()
+            except FileNotFoundError:
+                self._handler_missing = True
+        return self._metadata_handler
+
+    def _on_rows_read(self, results: List[Tuple[str, dict]], count: int):
+        if results:
+            self.table_manager.update_rows_metadata_by_path(results)
+        self._row_reads_pending -= count
+        if self._row_reads_pending == 0:
+            self._on_row_reads_done()
+
+    def _on_row_reads_done(self):
+        self._refresh_metadata_panel(force=True)
+        self.update_ui_state()
 
     # -------------------- Undo --------------------
 
@@ -1092,7 +1306,7 @@ class MainWindow(QMainWindow):
             return
 
         batch = self.undo_manager.peek_last()
-        if not batch or not batch.changes:
+        if not batch or not batch.count:
             QMessageBox.information(self, DIALOG_INFORMATION, MSG_UNDO_EMPTY)
             return
 
@@ -1105,26 +1319,25 @@ class MainWindow(QMainWindow):
         self.undo_thread.cancelled.connect(self._on_undo_cancelled)
         self.undo_thread.finished.connect(self._on_undo_finished)
 
-        self.batch_progress.setMaximum(len(batch.changes))
+        self.batch_progress.setMaximum(batch.count)
         self.batch_progress.setValue(0)
         self.file_progress.setMaximum(100)
         self.file_progress.setValue(0)
         self.file_status_label.setText("")
+        self._reset_progress_throttle()
 
         self.add_info(STATUS_UNDO_START)
         self.update_ui_state()
         self.undo_thread.start()
 
     def _on_undo_progress(self, current: int, total: int):
-        self.batch_progress.setMaximum(total)
-        self.batch_progress.setValue(current)
+        self._apply_batch_progress(current, total)
 
     def _on_undo_file_progress(self, done: int, total: int, filename: str):
-        pct = int((done / total) * 100) if total else 0
-        self.file_progress.setValue(pct)
-        self.file_status_label.setText(STATUS_UNDO_FILE.format(done, total, filename))
+        self._apply_file_progress(STATUS_UNDO_FILE, done, total, filename)
 
     def _on_undo_error(self, msg: str):
+        self._flush_progress()
         QMessageBox.critical(self, DIALOG_UNDO_ERROR, msg)
         self.add_info(f"{DIALOG_UNDO_ERROR}: {msg}")
         self._active_undo_batch = None
@@ -1132,12 +1345,14 @@ class MainWindow(QMainWindow):
         self.update_ui_state()
 
     def _on_undo_cancelled(self):
+        self._flush_progress()
         self.add_info(STATUS_UNDO_CANCELLED)
         self._active_undo_batch = None
         self.undo_thread = None
         self.update_ui_state()
 
     def _on_undo_finished(self, stats: dict, failures: List[dict]):
+        self._flush_progress()
         self.add_info(STATUS_UNDO_COMPLETE.format(
             stats.get("restored", 0), stats.get("failures", 0)
         ))
@@ -1146,37 +1361,11 @@ class MainWindow(QMainWindow):
         else:
             self.undo_manager.pop_last()
 
-        # Refresh everything (simple strategy)
-        try:
-            handler = MetadataHandler()
-        except FileNotFoundError:
-            handler = None
-
-        if handler:
-            paths = []
-            seen = set()
-            for row in range(self.table_manager.table.rowCount()):
-                fi = self.table_manager.table.item(row, int(Col.FILENAME))
-                if not fi:
-                    continue
-                fd = fi.data(Qt.ItemDataRole.UserRole) or {}
-                path = fd.get("filepath") or fd.get("path")
-                if path and path not in seen:
-                    seen.add(path)
-                    paths.append(path)
-
-            for path in paths:
-                meta = handler.read_metadata(path)
-                self.table_manager.update_row_metadata_by_path(path, {
-                    "title": meta.title or "",
-                    "author": meta.author or "",
-                    "subject": meta.subject or "",
-                    "keywords": meta.keywords or "",
-                })
-
-        self._refresh_metadata_panel(force=True)
         self._active_undo_batch = None
         self.undo_thread = None
+
+        # Refresh everything (simple strategy)
+        self._read_rows_async(self.table_manager.get_all_paths())
         self.update_ui_state()
 
     # -------------------- Errors, miscellaneous --------------------
@@ -1218,6 +1407,7 @@ class MainWindow(QMainWindow):
         undo_active = bool(self.undo_thread and self.undo_thread.isRunning())
 
         if not (loader_active or writer_active or undo_active):
+            self.undo_manager.clear()  # deletes the on-disk undo journals
             event.accept()
             return
 
@@ -1246,6 +1436,7 @@ class MainWindow(QMainWindow):
             if not self.loader_manager.stop_loading():
                 event.ignore()
                 return
+        self.undo_manager.clear()
         event.accept()
 
     def show_help(self):
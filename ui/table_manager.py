@@ -5,11 +5,21 @@ Handles table creation, population, and selection operations.
 """
 from __future__ import annotations
 
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Tuple
 from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
-from PyQt6.QtCore import Qt, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QSignalBlocker
 from ui.constants import *
 
+# Filepath string on the FILENAME item, next to the full file-data dict in UserRole.
+# Path scans read this instead of marshalling the whole dict per row.
+PATH_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Plain-int column indices for the per-row/per-cell paths (no IntEnum conversion per call)
+_C_CHECK = int(Col.CHECK)
+_C_FILENAME = int(Col.FILENAME)
+_COL_IDX_INT: Dict[str, int] = {field: int(col) for field, col in COL_INDEX.items()}
+
 
 class FileTableManager(QObject):
     """Manages the file table widget and its operations."""
@@ -20,7 +30,17 @@ class FileTableManager(QObject):
         super().__init__(parent)
         self.table = QTableWidget()
         self._sorting_before_bulk_load = True
+        # Row indices of checked rows, maintained incrementally (rebuilt after sorts)
+        self._checked_rows: set[int] = set()
+        # Rows whose checkbox is enabled (not protected/corrupted); same upkeep as _checked_rows
+        self._selectable_rows: List[int] = []
+        # filepath -> row; entries are verified on lookup since sorting can move rows
+        self._path_to_row: Dict[str, int] = {}
+        # Inside _path_lookups(): whether the index was already rebuilt for this batch
+        self._lookup_batch = False
+        self._index_rebuilt = False
         self.setup_table()
+        self.table.model().layoutChanged.connect(self._rebuild_row_sets)
         
     def setup_table(self):
         """Configure the table widget."""
@@ -32,8 +52,9 @@ class FileTableManager(QObject):
         header.setSortIndicatorShown(True)
 
         # Sizing:
-        #  - Checkbox tight
-        header.setSectionResizeMode(int(Col.CHECK), QHeaderView.ResizeMode.ResizeToContents)
+        #  - Checkbox tight. Fixed (not ResizeToContents) so the header never samples
+        #    every row's size hint - and with it every paint role - on layout passes.
+        header.setSectionResizeMode(int(Col.CHECK), QHeaderView.ResizeMode.Fixed)
         header.resizeSection(int(Col.CHECK), 30)
 
         #  - Filename stretches to fill space
@@ -63,6 +84,9 @@ class FileTableManager(QObject):
     def clear(self):
         """Clear all rows from the table."""
         self.table.setRowCount(0)
+        self._checked_rows.clear()
+        self._selectable_rows.clear()
+        self._path_to_row.clear()
 
     def begin_bulk_load(self):
         """Pause sorting while rows stream in so cells stay attached to their row."""
@@ -75,16 +99,33 @@ class FileTableManager(QObject):
         
     def add_file(self, file_data: dict) -> int:
         """Add a file to the table. Returns row index."""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        
+        return self.add_files([file_data])[0]
+
+    def add_files(self, rows: List[Dict]) -> List[int]:
+        """Append several files with a single row-count change. Returns their row indices (before any re-sort)."""
+        start = self.table.rowCount()
+        # Rows must not move while their cells go in; a live sort is re-applied once at the end
+        sorting_was_enabled = self.table.isSortingEnabled()
+        if sorting_was_enabled:
+            self.table.setSortingEnabled(False)
+        try:
+            self.table.setRowCount(start + len(rows))
+            for row, file_data in enumerate(rows, start):
+                self._fill_row(row, file_data)
+        finally:
+            if sorting_was_enabled:
+                self.table.setSortingEnabled(True)   # re-sort re-derives row sets (layoutChanged)
+        return list(range(start, start + len(rows)))
+
+    def _fill_row(self, row: int, file_data: dict):
         # Checkbox column
+        selectable = not (file_data.get('is_protected') or file_data.get('is_corrupted'))
         cb = QTableWidgetItem()
         cb.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-        if file_data.get('is_protected') or file_data.get('is_corrupted'):
+        if not selectable:
             cb.setFlags(Qt.ItemFlag.ItemIsUserCheckable)
         cb.setCheckState(Qt.CheckState.Unchecked)
-        self.table.setItem(row, 0, cb)
+        self.table.setItem(row, _C_CHECK, cb)
         
         # Filename column with icons and tooltips
         fname = file_data.get('filename', '')
@@ -93,8 +134,10 @@ class FileTableManager(QObject):
         elif file_data.get('filename_warning'):
             fname = TEXT_FILENAME_WARNING + " " + fname
             
+        path = file_data.get('filepath') or file_data.get('path') or ''
         fi = self._readonly_item(fname)
         fi.setData(Qt.ItemDataRole.UserRole, file_data)
+        fi.setData(PATH_ROLE, path)
         
         if file_data.get('filename_warning'):
             fi.setToolTip(file_data['filename_warning'])
@@ -103,51 +146,69 @@ class FileTableManager(QObject):
         elif file_data.get('is_corrupted'):
             fi.setToolTip(file_data.get('error_message', 'Corrupted PDF'))
             
-        self.table.setItem(row, int(Col.FILENAME), fi)
+        self.table.setItem(row, _C_FILENAME, fi)
         
         # Metadata columns (uniform)
         for field in METADATA_FIELDS:
-            col = int(COL_INDEX[field])
+            col = _COL_IDX_INT[field]
             self.table.setItem(row, col, self._readonly_item(file_data.get(field, "")))
-        return row
+
+        if path:
+            self._path_to_row[path] = row
+        if selectable:
+            self._selectable_rows.append(row)
     
     def get_selected_files(self) -> List[Dict]:
-        """Get list of file data for all checked rows."""
+        """Get list of file data for all checked rows (in table order)."""
         selected = []
-        for row in range(self.table.rowCount()):
-            cb = self.table.item(row, 0)
-            if cb and cb.checkState() == Qt.CheckState.Checked:
-                fi = self.table.item(row, int(Col.FILENAME))
-                if fi:
-                    fd = fi.data(Qt.ItemDataRole.UserRole)
-                    if fd:
-                        selected.append(fd)
+        item = self.table.item
+        user_role = Qt.ItemDataRole.UserRole
+        for row in sorted(self._checked_rows):
+            fi = item(row, _C_FILENAME)
+            if fi is None:
+                continue
+            fd = fi.data(user_role)
+            if fd:
+                selected.append(fd)
         return selected
+
+    def selected_count(self) -> int:
+        """Number of checked rows, without building the file-data list."""
+        return len(self._checked_rows)
     
     def select_all(self):
         """Check all enabled rows."""
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.flags() & Qt.ItemFlag.ItemIsEnabled:
-                item.setCheckState(Qt.CheckState.Checked)
+        # Per-row itemChanged is suppressed; one selection_changed is emitted at the end.
+        with self._stable_rows(), QSignalBlocker(self.table):
+            item = self.table.item
+            checked = Qt.CheckState.Checked
+            for row in self._selectable_rows:
+                item(row, _C_CHECK).setCheckState(checked)
+            self._checked_rows.update(self._selectable_rows)
         self.selection_changed.emit()
         
     def select_none(self):
         """Uncheck all rows."""
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
+        with self._stable_rows(), QSignalBlocker(self.table):
+            item = self.table.item
+            unchecked = Qt.CheckState.Unchecked
+            for row in self._checked_rows:
+                item(row, _C_CHECK).setCheckState(unchecked)
+            self._checked_rows.clear()
         self.selection_changed.emit()
         
     def invert_selection(self):
         """Toggle check state for enabled rows."""
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.flags() & Qt.ItemFlag.ItemIsEnabled:
-                current = item.checkState()
-                item.setCheckState(Qt.CheckState.Unchecked if current == Qt.CheckState.Checked 
-                                  else Qt.CheckState.Checked)
+        with self._stable_rows(), QSignalBlocker(self.table):
+            item = self.table.item
+            checked_rows = self._checked_rows
+            for row in self._selectable_rows:
+                if row in checked_rows:
+                    item(row, _C_CHECK).setCheckState(Qt.CheckState.Unchecked)
+                    checked_rows.discard(row)
+                else:
+                    item(row, _C_CHECK).setCheckState(Qt.CheckState.Checked)
+                    checked_rows.add(row)
         self.selection_changed.emit()
     
     def update_row_metadata(self, row: int, metadata: dict):
@@ -161,21 +222,32 @@ class FileTableManager(QObject):
             self.table.setSortingEnabled(False)
 
         try:
-            # Uniform cell updates based on field->column mapping
-            for field, value in metadata.items():
-                if field in COL_INDEX:
-                    self.table.setItem(row, int(COL_INDEX[field]), self._readonly_item(value or ""))
-
-            # Update stored data blob on the filename cell
-            fi = self.table.item(row, int(Col.FILENAME))
-            if fi:
-                fd = fi.data(Qt.ItemDataRole.UserRole) or {}
-                fd.update(metadata)
-                fi.setData(Qt.ItemDataRole.UserRole, fd)
+            self._update_row_metadata_nolock(row, metadata)
         finally:
             if sorting_was_enabled:
                 self.table.setSortingEnabled(True)
 
+    def _update_row_metadata_nolock(self, row: int, metadata: dict):
+        """Cell + data-blob update; the caller keeps sorting off so `row` cannot move."""
+        # Uniform cell updates based on field->column mapping; existing cells are edited in place
+        for field, value in metadata.items():
+            col = _COL_IDX_INT.get(field)
+            if col is None:
+                continue
+            item = self.table.item(row, col)
+            if item is None:
+                self.table.setItem(row, col, self._readonly_item(value or ""))
+            else:
+                item.setText(value or "")
+
+        # Update stored data blob on the filename cell
+        fi = self.table.item(row, _C_FILENAME)
+        if fi:
+            fd = fi.data(Qt.ItemDataRole.UserRole) or {}
+            fd.update(metadata)
+            fd.pop("metadata_stale", None)
+            fi.setData(Qt.ItemDataRole.UserRole, fd)
+
     def update_row_metadata_by_path(self, filepath: str, metadata: dict) -> bool:
         """Update metadata display using file path lookup to avoid stale row indexes."""
         row = self.get_row_by_path(filepath)
@@ -183,23 +255,74 @@ class FileTableManager(QObject):
             return False
         self.update_row_metadata(row, metadata)
         return True
+
+    def update_rows_metadata_by_path(self, updates: List[Tuple[str, dict]]) -> int:
+        """Apply many (filepath, metadata) updates in one batch. Returns the number of rows updated."""
+        updated = 0
+        with self._batch_update(), self._path_lookups():
+            for filepath, metadata in updates:
+                row = self.get_row_by_path(filepath)
+                if row is not None:
+                    self._update_row_metadata_nolock(row, metadata)
+                    updated += 1
+        return updated
     
+    def mark_rows_stale(self, paths: List[str]) -> None:
+        """
+        Flag rows whose file changed on disk; the flag is cleared when fresh metadata is
+        applied. Writers re-read flagged rows instead of trusting their cached values.
+        """
+        with self._batch_update(), self._path_lookups():
+            for filepath in paths:
+                row = self.get_row_by_path(filepath)
+                fi = self.table.item(row, _C_FILENAME) if row is not None else None
+                if fi is None:
+                    continue
+                fd = fi.data(Qt.ItemDataRole.UserRole) or {}
+                fd["metadata_stale"] = True
+                fi.setData(Qt.ItemDataRole.UserRole, fd)
+
     def get_row_by_path(self, filepath: str) -> Optional[int]:
         """Find row index for a given file path."""
+        row = self._path_to_row.get(filepath)
+        if row is not None and self._row_path(row) == filepath:
+            return row
+        # Within a lookup batch rows cannot move, so after one re-index a miss means absent
+        if self._lookup_batch and self._index_rebuilt:
+            return None
+        # Stale or missing entry (rows were sorted/reordered): re-index once and retry
+        self._rebuild_path_index()
+        self._index_rebuilt = True
+        return self._path_to_row.get(filepath)
+
+    def get_all_paths(self) -> List[str]:
+        """File paths of all rows in table order (duplicates and path-less rows dropped)."""
+        return [path for _row, path in self._iter_row_paths()]
+
+    def _row_path(self, row: int) -> Optional[str]:
+        fi = self.table.item(row, _C_FILENAME)
+        return fi.data(PATH_ROLE) if fi else None
+
+    def _iter_row_paths(self):
+        """Yield (row, path) once per distinct path, first row wins."""
+        item = self.table.item
+        seen = set()
         for row in range(self.table.rowCount()):
-            fi = self.table.item(row, int(Col.FILENAME))
-            if fi:
-                fd = fi.data(Qt.ItemDataRole.UserRole)
-                if fd and (fd.get('filepath') or fd.get('path')) == filepath:
-                    return row
-        return None
+            fi = item(row, _C_FILENAME)
+            path = fi.data(PATH_ROLE) if fi else None
+            if path and path not in seen:
+                seen.add(path)
+                yield row, path
+
+    def _rebuild_path_index(self):
+        self._path_to_row = {path: row for row, path in self._iter_row_paths()}
 
     def get_current_file_data(self) -> Optional[Dict]:
         """Return file-data blob for the currently focused row, if any."""
         row = self.table.currentRow()
         if row < 0:
             return None
-        fi = self.table.item(row, int(Col.FILENAME))
+        fi = self.table.item(row, _C_FILENAME)
         if not fi:
             return None
         fd = fi.data(Qt.ItemDataRole.UserRole)
@@ -208,14 +331,76 @@ class FileTableManager(QObject):
     def get_counts(self) -> Dict[str, int]:
         """Get counts of total and selected files."""
         total = self.table.rowCount()
-        selected = len(self.get_selected_files())
+        selected = self.selected_count()
         return {'total': total, 'selected': selected}
     
     def _on_item_changed(self, item):
         """Handle checkbox state changes."""
-        if item.column() == 0:
+        if item.column() == _C_CHECK:
+            if item.checkState() == Qt.CheckState.Checked:
+                self._checked_rows.add(item.row())
+            else:
+                self._checked_rows.discard(item.row())
             self.selection_changed.emit()
 
+    @contextmanager
+    def _batch_update(self):
+        """
+        Freeze the table for a burst of cell updates: no repaints, no itemChanged,
+        no re-sorting until the block ends (then one sort and one repaint).
+        """
+        table = self.table
+        updates_were_enabled = table.updatesEnabled()
+        sorting_was_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        signals_were_blocked = table.blockSignals(True)
+        if sorting_was_enabled:
+            table.setSortingEnabled(False)
+        try:
+            yield
+        finally:
+            if sorting_was_enabled:
+                table.setSortingEnabled(True)
+            table.blockSignals(signals_were_blocked)
+            table.setUpdatesEnabled(updates_were_enabled)
+
+    @contextmanager
+    def _path_lookups(self):
+        """Batch of get_row_by_path calls with rows held still: the index is rebuilt at most once."""
+        self._lookup_batch, self._index_rebuilt = True, False
+        try:
+            yield
+        finally:
+            self._lookup_batch = False
+
+    @contextmanager
+    def _stable_rows(self):
+        """Keep row indices fixed while check states change (only matters when sorted by the check column)."""
+        resort = (self.table.isSortingEnabled()
+                  and self.table.horizontalHeader().sortIndicatorSection() == _C_CHECK)
+        if resort:
+            self.table.setSortingEnabled(False)
+        try:
+            yield
+        finally:
+            if resort:
+                self.table.setSortingEnabled(True)
+
+    def _rebuild_row_sets(self):
+        """Re-derive checked/selectable row indices after a sort moved rows around."""
+        checked = set()
+        selectable = []
+        for row in range(self.table.rowCount()):
+            cb = self.table.item(row, _C_CHECK)
+            if not cb:
+                continue
+            if cb.flags() & Qt.ItemFlag.ItemIsEnabled:
+                selectable.append(row)
+            if cb.checkState() == Qt.CheckState.Checked:
+                checked.add(row)
+        self._checked_rows = checked
+        self._selectable_rows = selectable
+
     @staticmethod
     def _readonly_item(text: str) -> QTableWidgetItem:
         item = QTableWidgetItem(text or "")
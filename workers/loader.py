@@ -1,18 +1,50 @@
 # workers/loader.py
 from __future__ import annotations
 
+import array
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Iterable, Tuple, Optional
 from PyQt6.QtCore import QObject, pyqtSignal, QThread
 from infra.logging import log_worker_event 
 
-from core.metadata import MetadataHandler
+from core.metadata import MetadataHandler, PDFMetadata, file_signature
 from core.rules import validate_filename
 
+# Parallel metadata reads during a scan. Each read runs ExifTool subprocesses, which
+# are CPU-bound, so going far past the core count only adds contention.
+_READ_WORKERS = min(16, (os.cpu_count() or 1) * 2)
 
-@dataclass
+# Files per ExifTool process (read_metadata_batch); small scans use smaller chunks
+# so every worker still gets a share.
+_READ_CHUNK = 128
+
+# Rows are streamed to the UI in batches: flushed at this many rows or after this many
+# seconds, whichever comes first. Progress is sent at most every _PROGRESS_INTERVAL s.
+_ROW_BATCH = 50
+_ROW_BATCH_INTERVAL = 0.1
+_PROGRESS_INTERVAL = 0.05
+
+# While waiting on a chunk, a cancel request is noticed within this many seconds.
+_CANCEL_POLL = 0.1
+
+
+@lru_cache(maxsize=8192)
+def _cached_filename_warning(filename: str) -> str:
+    """validate_filename memoized per name (templated/duplicate names are common).
+    Results depend on today's date, so the cache is cleared at the start of each scan."""
+    try:
+        return validate_filename(filename) or ""
+    except Exception:
+        return ""
+
+
+@dataclass(slots=True)
 class FileRecord:
+    """Schema of the row dicts streamed by LoaderWorker (kept for typing/reference)."""
     filepath: str
     filename: str
     in_subfolder: bool
@@ -24,13 +56,17 @@ class FileRecord:
     is_corrupted: bool = False
     error_message: str = ""
     filename_warning: str = ""
+    metadata_stale: bool = False
+    # File state when the metadata was read; the writer re-reads files that no longer match
+    st_mtime_ns: Optional[int] = None
+    st_size: Optional[int] = None
 
 
 class LoaderWorker(QThread):
     """Scans a folder recursively for PDFs, reads metadata, computes warnings, and streams results."""
     progress = pyqtSignal(int, int)            # current, total discovered PDFs
     status = pyqtSignal(str)                   # short status lines for the UI console
-    file_found = pyqtSignal(dict)              # emits a dict per file (for table row)
+    file_found_batch = pyqtSignal(list)        # emits row dicts in batches (for table rows)
     scan_complete = pyqtSignal(list)           # emits full list on completion
     error = pyqtSignal(str)                    # fatal errors
     subfolder_warning = pyqtSignal(list)       # list of subfolder relative paths (for the once-per-scan warning)
@@ -40,26 +76,65 @@ class LoaderWorker(QThread):
         self.root = os.path.abspath(root_folder)
         self._stop = False
         self._results: List[Dict] = []
+        # Relative paths of subfolders holding at least one PDF; filled by _iter_pdfs
+        self._subfolders: set[str] = set()
 
     def stop(self):
         self._stop = True
 
     # ---- internal helpers ----
     def _iter_pdfs(self) -> Iterable[Tuple[str, str, bool]]:
-        root_len = len(self.root.rstrip("\\/")) + 1
-        for dirpath, _dirs, files in os.walk(self.root):
-            for name in files:
-                if name.lower().endswith(".pdf"):
-                    full = os.path.join(dirpath, name)
-                    rel = full[root_len:] if full.startswith(self.root) else name
-                    in_sub = os.path.sep in rel
-                    yield full, name, in_sub
+        """
+        Walk the tree with os.scandir: DirEntry type checks come from the directory
+        listing itself, so no extra stat() per entry. Mirrors os.walk defaults:
+        unreadable folders are skipped and symlinked folders are not descended.
+        An explicit stack (not nested generators) keeps per-file cost flat at any depth.
+        Subfolders that contain PDFs are collected into self._subfolders along the way.
+        """
+        self._subfolders = set()
+        # Frames carry the folder's path relative to root ("" for root itself)
+        stack: List[Tuple[str, str]] = [(self.root, "")]
+        while stack:
+            dirpath, rel_dir = stack.pop()
+            in_sub = bool(rel_dir)
+            subdirs: List[Tuple[str, str]] = []
+            has_pdf = False
+            try:
+                it = os.scandir(dirpath)
+            except OSError:
+                continue
+            try:
+                with it:
+                    for entry in it:
+                        # Suffix check lowercases only the last 4 chars, not every name in the tree
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append((entry.path, rel_dir + os.sep + entry.name if rel_dir else entry.name))
+                        elif entry.name[-4:].lower() == ".pdf" and entry.is_file():
+                            if in_sub and not has_pdf:
+                                has_pdf = True
+                                self._subfolders.add(rel_dir)
+                            yield entry.path, entry.name, in_sub
+            except OSError:
+                # Listing broke off (entry vanished, permission change): keep what was seen
+                pass
+            finally:
+                # Directory handle is closed before descending; reversed so listing order is kept
+                stack.extend(reversed(subdirs))
 
     def _safe_validate_filename(self, filename: str) -> str:
-        try:
-            return validate_filename(filename) or ""
-        except Exception:
-            return ""
+        return _cached_filename_warning(filename)
+
+    @staticmethod
+    def _read_chunk(handler: MetadataHandler, paths: List[str]) -> Tuple[List[PDFMetadata], List[Optional[Tuple[int, int]]]]:
+        """Read a chunk's metadata; each file is stat'ed first so a later change is detectable."""
+        signatures = [file_signature(p) for p in paths]
+        return handler.read_metadata_batch(paths), signatures
+
+    @staticmethod
+    def _failed_read(path: str, error: Exception) -> PDFMetadata:
+        md = PDFMetadata(path)
+        md.error_message = f"Error reading metadata: {error}"
+        return md
 
     def run(self):
         # Discover first so we know the total
@@ -71,15 +146,13 @@ class LoaderWorker(QThread):
             return
 
         total = len(discovered)
+        _cached_filename_warning.cache_clear()
         log_worker_event("Loader", "started", f"{total} PDFs in {self.root}") 
         self.progress.emit(0, total)
         self.status.emit(f"Scanning… found {total} PDF(s).")
 
-        # Compute subfolder list once (relative paths)
-        subfolders = sorted(
-            {os.path.dirname(p[len(self.root)+1:]) for (p, _n, _s) in discovered
-             if p.startswith(self.root) and os.path.dirname(p[len(self.root)+1:])}
-        )
+        # Collected during the walk (relative paths)
+        subfolders = sorted(self._subfolders)
         if subfolders:
             self.subfolder_warning.emit(subfolders)
 
@@ -92,49 +165,92 @@ class LoaderWorker(QThread):
 
         results: List[Dict] = []
         done = 0
-        for path, name, in_sub in discovered:
-            if self._stop:
-                self.status.emit("Scan cancelled.")
-                self.scan_complete.emit(results)
-                return
-
-            md = handler.read_metadata(path)
-            warn = self._safe_validate_filename(name)
-
-            rec = FileRecord(
-                filepath=path,
-                filename=name,
-                in_subfolder=in_sub,
-                title=md.title,
-                author=md.author,
-                subject=md.subject,
-                keywords=md.keywords,
-                is_protected=md.is_protected,
-                is_corrupted=md.is_corrupted,
-                error_message=md.error_message,
-                filename_warning=warn
-            )
-
-            row = {
-                "filepath": rec.filepath,
-                "filename": rec.filename,
-                "in_subfolder": rec.in_subfolder,
-                "title": rec.title,
-                "author": rec.author,
-                "subject": rec.subject,
-                "keywords": rec.keywords,
-                "is_protected": rec.is_protected,
-                "is_corrupted": rec.is_corrupted,
-                "error_message": rec.error_message,
-                "filename_warning": rec.filename_warning,
-            }
-            results.append(row)
-            self.file_found.emit(row)
-
-            done += 1
-            self.progress.emit(done, total)
+        pending: List[Dict] = []
+        last_flush = last_progress = time.monotonic()
+
+        def _flush():
+            nonlocal pending
+            if pending:
+                self.file_found_batch.emit(pending)
+                pending = []
+
+        # Reads run in chunks (one ExifTool process per chunk) on a pool; MetadataHandler
+        # keeps no per-call state, so one is shared. Chunks are consumed in discovery
+        # order so rows stream in a stable order.
+        workers = max(1, min(_READ_WORKERS, total))
+        chunk = max(1, min(_READ_CHUNK, -(-total // workers)))
+        chunks = [discovered[i:i + chunk] for i in range(0, total, chunk)]
+        read_failures = 0
+        first_error = ""
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf-read")
+        try:
+            futures = [pool.submit(self._read_chunk, handler, [p for p, _n, _s in c]) for c in chunks]
+            for fut, items in zip(futures, chunks):
+                # Poll so a cancel does not wait for the chunk being read
+                while not self._stop and not wait((fut,), timeout=_CANCEL_POLL).done:
+                    pass
+                if self._stop:
+                    _flush()
+                    self.progress.emit(done, total)
+                    self.status.emit("Scan cancelled.")
+                    self.scan_complete.emit(results)
+                    return
+
+                try:
+                    mds, signatures = fut.result()
+                except Exception as e:
+                    # Mark the chunk's files as errored (as a failed single read would) and carry on
+                    log_worker_event("Loader", "error", f"Read failed for {len(items)} file(s): {e}")
+                    mds = [self._failed_read(path, e) for path, _n, _s in items]
+                    signatures = [None] * len(items)
+                    read_failures += len(items)
+                    first_error = first_error or str(e)
+
+                for md, sig, (path, name, in_sub) in zip(mds, signatures, items):
+                    warn = self._safe_validate_filename(name)
+
+                    # Rows carry FileRecord's fields; build the dict directly
+                    row = {
+                        "filepath": path,
+                        "filename": name,
+                        "in_subfolder": in_sub,
+                        "title": md.title,
+                        "author": md.author,
+                        "subject": md.subject,
+                        "keywords": md.keywords,
+                        "is_protected": md.is_protected,
+                        "is_corrupted": md.is_corrupted,
+                        "error_message": md.error_message,
+                        "filename_warning": warn,
+                        # Unread values must not serve as the base for a later write
+                        "metadata_stale": bool(md.error_message),
+                        "st_mtime_ns": sig[0] if sig else None,
+                        "st_size": sig[1] if sig else None,
+                    }
+                    results.append(row)
+                    pending.append(row)
+                    done += 1
+
+                    now = time.monotonic()
+                    if len(pending) >= _ROW_BATCH or now - last_flush >= _ROW_BATCH_INTERVAL:
+                        _flush()
+                        last_flush = now
+                    if now - last_progress >= _PROGRESS_INTERVAL:
+                        self.progress.emit(done, total)
+                        last_progress = now
+
+                # Nothing waits in the buffer while the next chunk is still being read
+                _flush()
+                self.progress.emit(done, total)
+                last_flush = last_progress = time.monotonic()
+        finally:
+            # Never block on chunks still running (cancel must return promptly); queued ones are dropped
+            pool.shutdown(wait=False, cancel_futures=True)
 
         log_worker_event("Loader", "finished", f"{len(results)} files loaded") 
+        if read_failures:
+            # Not fatal: the rows are in the table, flagged with the error
+            self.status.emit(f"Could not read metadata for {read_failures} file(s): {first_error}")
         self.status.emit("Scan complete.") 
         self.scan_complete.emit(results) 
 
@@ -145,7 +261,7 @@ class LoaderManager(QObject):
     """
     progress = pyqtSignal(int, int)
     status = pyqtSignal(str)
-    file_found = pyqtSignal(dict)
+    files_found = pyqtSignal(list)
     scan_complete = pyqtSignal(list)
     error = pyqtSignal(str)
     subfolder_warning = pyqtSignal(list)
@@ -155,19 +271,25 @@ class LoaderManager(QObject):
         self._worker: Optional[LoaderWorker] = None
         self.loaded_files: List[Dict] = []
 
-        # cache last computed stats
+        # Per-row status flags, index-aligned with loaded_files, and running counters;
+        # both are maintained as rows stream in. has_stats flips once a scan has completed.
+        self._prot = array.array("b")
+        self._warn = array.array("b")
+        self._err = array.array("b")
         self._stats = {"total": 0, "warnings": 0, "protected": 0}
+        self.has_stats = False
 
     def start_loading(self, folder: str):
         if not self.stop_loading():
             self.error.emit("Previous scan is still stopping. Please try again in a moment.")
             return
-        self.loaded_files = []
+        self._reset_index()
+        self.has_stats = False
         self._worker = LoaderWorker(folder)
         # connect pass-through signals
         self._worker.progress.connect(self.progress)
         self._worker.status.connect(self.status)
-        self._worker.file_found.connect(self._on_file_found)
+        self._worker.file_found_batch.connect(self._on_files_found)
         self._worker.scan_complete.connect(self._on_scan_complete)
         self._worker.error.connect(self.error)
         self._worker.subfolder_warning.connect(self.subfolder_warning)
@@ -186,33 +308,47 @@ class LoaderManager(QObject):
         return bool(self._worker and self._worker.isRunning())
 
     # ---- signal handlers ----
-    def _on_file_found(self, row: Dict):
-        self.loaded_files.append(row)
-        self.file_found.emit(row)
+    def _on_files_found(self, rows: List[Dict]):
+        self._index_rows(rows)
+        self.files_found.emit(rows)
 
     def _on_scan_complete(self, rows: List[Dict]):
-        self.loaded_files = rows
-        self._recompute_stats()
+        # The streamed batches normally add up to the final list; rebuild only if not
+        if len(rows) != len(self.loaded_files):
+            self._reset_index()
+            self._index_rows(rows)
+        else:
+            self.loaded_files = rows
+        self.has_stats = True
         self.scan_complete.emit(rows)
 
+    def _reset_index(self):
+        self.loaded_files = []
+        self._prot = array.array("b")
+        self._warn = array.array("b")
+        self._err = array.array("b")
+        self._stats = {"total": 0, "warnings": 0, "protected": 0}
+
+    def _index_rows(self, rows: List[Dict]):
+        stats = self._stats
+        for r in rows:
+            prot = bool(r.get("is_protected"))
+            warn = bool(r.get("filename_warning"))
+            self._prot.append(prot)
+            self._warn.append(warn)
+            self._err.append(bool(r.get("is_corrupted") or r.get("error_message")))
+            stats["protected"] += prot
+            stats["warnings"] += warn
+        self.loaded_files.extend(rows)
+        stats["total"] = len(self.loaded_files)
+
     # ---- public helpers used by UI ----
     def get_statistics(self) -> Dict[str, int]:
-        if not self.loaded_files:
-            return {"total": 0, "warnings": 0, "protected": 0}
         return dict(self._stats)
 
-    def _recompute_stats(self):
-        total = len(self.loaded_files)
-        warnings = sum(1 for r in self.loaded_files if r.get("filename_warning"))
-        protected = sum(1 for r in self.loaded_files if r.get("is_protected"))
-        self._stats = {"total": total, "warnings": warnings, "protected": protected}
-
     def get_files_by_status(self, status: str) -> List[Dict]:
-        if status == "protected":
-            return [r for r in self.loaded_files if r.get("is_protected")]
-        if status == "warning":
-            return [r for r in self.loaded_files if r.get("filename_warning")]
-        if status == "error":
-            return [r for r in self.loaded_files if r.get("is_corrupted") or r.get("error_message")]
-            # kept for compatibility with UI's optional group
-        return []
+        flags = {"protected": self._prot, "warning": self._warn, "error": self._err}.get(status)
+        if flags is None:
+            return []
+        rows = self.loaded_files
+        return [rows[i] for i, v in enumerate(flags) if v]
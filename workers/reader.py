@@ -0,0 +1,68 @@
+# workers/reader.py
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.metadata import MetadataHandler, file_signature
+
+
+class ReadSignals(QObject):
+    """Signal proxy for MetadataReadJob (QRunnable cannot emit on its own). Lives in the GUI thread."""
+    batch_done = pyqtSignal(object, int)       # [(path, metadata dict)], number of paths read (failures omitted)
+
+
+class ReadBatch:
+    """
+    Collects the results of one group of MetadataReadJobs on the pool threads and
+    posts them to the GUI thread in a single batch_done once the last job reports.
+    """
+
+    def __init__(self, count: int, signals: ReadSignals):
+        self._lock = threading.Lock()
+        self._count = count
+        self._remaining = count
+        self._results: List[Tuple[str, Dict[str, str]]] = []
+        self._signals = signals
+
+    def report(self, path: str, meta: Optional[Dict[str, str]]):
+        with self._lock:
+            if meta is not None:
+                self._results.append((path, meta))
+            self._remaining -= 1
+            last = self._remaining == 0
+        if last:
+            self._signals.batch_done.emit(self._results, self._count)
+
+
+class MetadataReadJob(QRunnable):
+    """
+    Re-reads one file's metadata on a QThreadPool thread and reports it to its ReadBatch.
+    MetadataHandler keeps no per-call state, so all jobs share the window's handler.
+    """
+
+    def __init__(self, path: str, batch: ReadBatch, handler: MetadataHandler):
+        super().__init__()
+        self.path = path
+        self.batch = batch
+        self.handler = handler
+
+    def run(self):
+        meta: Optional[Dict[str, str]] = None
+        try:
+            # Stat before reading so a change made during the read still counts as newer
+            sig = file_signature(self.path)
+            md = self.handler.read_metadata(self.path)
+            meta = {
+                "title": md.title or "",
+                "author": md.author or "",
+                "subject": md.subject or "",
+                "keywords": md.keywords or "",
+                "st_mtime_ns": sig[0] if sig else None,
+                "st_size": sig[1] if sig else None,
+            }
+        except Exception:
+            meta = None
+        # Always report back so the batch countdown completes
+        self.batch.report(self.path, meta)
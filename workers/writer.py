@@ -2,14 +2,15 @@
 from __future__ import annotations
 
 import os
-import re
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Tuple, Any
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from core.metadata import MetadataHandler
+from core.metadata import MetadataHandler, file_signature
 from core.rules import process_keywords
+from core.undo import Journal
 
 # Logging helper (best-effort; no hard failure if not present)
 try:
@@ -19,6 +20,43 @@ except Exception:  # pragma: no cover
         pass
 
 
+# Files written concurrently. Each write is an ExifTool subprocess plus a temp copy and
+# replace, so a handful of threads overlaps the process start-up and disk IO.
+_WRITE_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
+# Files whose edits are identical are written by one ExifTool run, up to this many per run.
+_WRITE_CHUNK = 64
+
+# A planned write: (input index, path, new values for the journal, fields to clear)
+_Planned = Tuple[int, str, Dict[str, str], Tuple[str, ...]]
+
+
+# Author/subject token merges (append) split on ';', ',' and '|'
+def _split_tokens(text: str) -> List[str]:
+    return text.replace(",", ";").replace("|", ";").split(";")
+
+
+def _merge_tokens(base: str, add: str) -> str:
+    """Append tokens of `add` to those of `base`, skipping case-insensitive repeats; joins with ', '."""
+    # A list plus a casefold set (not one casefold-keyed dict): base tokens are kept verbatim,
+    # repeats included, and the set membership test measured faster than dict.setdefault here.
+    merged: List[str] = []
+    seen: set = set()
+    for p in _split_tokens(base) if base else ():
+        p = p.strip()
+        if p:
+            merged.append(p)
+            seen.add(p.casefold())
+    for p in _split_tokens(add):
+        p = p.strip()
+        if p:
+            k = p.casefold()
+            if k not in seen:
+                seen.add(k)
+                merged.append(p)
+    return ", ".join(merged)
+
+
 class WriterWorker(QThread):
     """
     Threaded writer that applies metadata updates to a list of PDF files.
@@ -28,7 +66,12 @@ class WriterWorker(QThread):
         * "append":  merge into existing value (keywords -> canonicalize; author/subject -> token-merge)
         * "clear":   cleared explicitly via clear_metadata_fields()
         * "from_filename": title only, uses file stem
-    - Journals changes for Undo: list of tuples (path, old_values, new_values)
+    - Files are planned, then written, on a small thread pool; files sharing identical
+      edits are written together by one ExifTool run (MetadataHandler.write_metadata_batch)
+    - Journals changes for Undo: (path, old_values, new_values) records streamed to a
+      core.undo.Journal file as each write succeeds; finished carries its path
+    - Rows that already carry scanned metadata (loader/table dicts) are used as the
+      current state instead of re-reading each file; force_reread=True always re-reads.
     """
 
     # Signals
@@ -37,7 +80,7 @@ class WriterWorker(QThread):
     status = pyqtSignal(str)
     error = pyqtSignal(str)
     cancelled = pyqtSignal()
-    finished = pyqtSignal(dict, list, list)         # (stats, failures, journal)
+    finished = pyqtSignal(dict, list, str)          # (stats, failures, journal file path or "")
 
     def __init__(
         self,
@@ -45,11 +88,27 @@ class WriterWorker(QThread):
         updates: Dict[str, str],
         ops: Dict[str, str],
         parent: Optional[object] = None,
+        force_reread: bool = False,
+        workers: Optional[int] = None,
     ) -> None:
         super().__init__(parent)
         self._files = files or []
         self._updates = {str(k).lower(): v for k, v in (updates or {}).items()}
         self._ops = {str(k).lower(): str(v) for k, v in (ops or {}).items()}
+        # (field, op) pairs normalized once; an empty op means "replace"
+        self._normalized_ops: List[Tuple[str, str]] = [
+            (field, (op or "replace").lower()) for field, op in self._ops.items()
+        ]
+        self._clear_fields_l: Tuple[str, ...] = tuple(f for f, op in self._normalized_ops if op == "clear")
+        # False when no op can change any file (nothing to write, clear or derive)
+        self._has_any_work = any(
+            op_l == "clear"
+            or (op_l == "from_filename" and field_l == "title")
+            or str(self._updates.get(field_l) or "").strip()
+            for field_l, op_l in self._normalized_ops
+        )
+        self._force_reread = force_reread
+        self._workers = max(1, workers or _WRITE_WORKERS)
         self._cancel = False
 
     # -------------------- API --------------------
@@ -61,7 +120,12 @@ class WriterWorker(QThread):
 
     @staticmethod
     def _filename_stem(path: str) -> str:
-        return Path(path).stem
+        """Same result as Path(path).stem, using plain string ops (no PurePath per file)."""
+        if os.altsep:
+            path = path.replace(os.altsep, os.sep)
+        base = path.rsplit(os.sep, 1)[-1]
+        dot = base.rfind(".")
+        return base[:dot] if 0 < dot < len(base) - 1 else base
 
     @staticmethod
     def _resolve_path(item: Dict[str, Any] | str) -> str:
@@ -69,6 +133,19 @@ class WriterWorker(QThread):
             return item
         return item.get("filepath") or item.get("path") or item.get("fullpath") or item.get("full_path") or ""
 
+    @staticmethod
+    def _current_from_row(row: Dict[str, Any]) -> SimpleNamespace:
+        """Metadata-like view of a scanned row (same attributes the writer reads from read_metadata)."""
+        return SimpleNamespace(
+            title=row.get("title") or "",
+            author=row.get("author") or "",
+            subject=row.get("subject") or "",
+            keywords=row.get("keywords") or "",
+            is_protected=bool(row.get("is_protected", False)),
+            is_corrupted=bool(row.get("is_corrupted", False)),
+            error_message=row.get("error_message") or "",
+        )
+
     # -------------------- Core -------------------
 
     def _compute_updates_for_file(self, path: str, current) -> Dict[str, str]:
@@ -78,22 +155,19 @@ class WriterWorker(QThread):
         Notes:
           - Field names are normalized to lowercase keys: 'title', 'author', 'subject', 'keywords'
           - 'from_filename' is only valid for 'title'
-          - 'clear' is handled in run(), not here
+          - 'clear' is handled in _plan_one(), not here
           - Keywords are canonicalized via core.rules.process_keywords(combined)
           - Author/Subject 'append' merges tokens from ', ; |' with case-insensitive de-dup and emits comma+space
         """
         per_file: Dict[str, str] = {}
 
-        for field, op in (self._ops or {}).items():
-            field_l = (field or "").lower()
-            op_l = (op or "replace").lower()
-
+        for field_l, op_l in self._normalized_ops:
             # Special op: from_filename (title only)
             if op_l == "from_filename" and field_l == "title":
                 per_file[field_l] = self._filename_stem(path)
                 continue
 
-            # 'clear' handled later
+            # 'clear' handled in _plan_one()
             if op_l == "clear":
                 continue
 
@@ -115,17 +189,7 @@ class WriterWorker(QThread):
             # Author/Subject: append merges on , ; | with CI de-dup; replace direct
             if field_l in ("author", "subject"):
                 if op_l == "append":
-                    base = getattr(current, field_l, "") or ""
-                    base_parts = [p.strip() for p in re.split(r"[;,|]", base) if p.strip()] if base else []
-                    add_parts = [p.strip() for p in re.split(r"[;,|]", text) if p.strip()]
-                    seen = {p.casefold() for p in base_parts}
-                    merged: List[str] = base_parts[:]
-                    for p in add_parts:
-                        k = p.casefold()
-                        if k not in seen:
-                            seen.add(k)
-                            merged.append(p)
-                    per_file[field_l] = ", ".join(merged)
+                    per_file[field_l] = _merge_tokens(getattr(current, field_l, "") or "", text)
                 else:
                     per_file[field_l] = text
                 continue
@@ -139,6 +203,89 @@ class WriterWorker(QThread):
 
         return per_file
 
+    def _plan_one(self, handler: MetadataHandler, item: Dict[str, Any] | str) -> Tuple[str, str, str, Dict[str, str], Dict[str, str], List[str], str]:
+        """
+        Read (or reuse) current metadata for one file and work out its edits. Runs on a
+        pool thread. Returns (status, name, path, old_values, new_values, clears, message):
+          - "write":   old_values/new_values hold the edit for the journal (cleared fields
+                       map to ""); clears lists the fields to clear explicitly
+          - "skipped": message is the notice to show, if any
+          - "failed":  message is the error
+        """
+        path = self._resolve_path(item)
+        name = os.path.basename(path) if path else "(unknown)"
+
+        # Announce start of this file so the progress label updates immediately.
+        self.file_progress.emit(0, 1, name)
+
+        sig = file_signature(path) if path else None
+        if sig is None:
+            return "failed", name, path, {}, {}, [], "File not found"
+
+        # Current metadata: reuse what the scan already read, unless the file changed since
+        try:
+            if (not self._force_reread and isinstance(item, dict) and "title" in item
+                    and not item.get("metadata_stale")
+                    and (item.get("st_mtime_ns"), item.get("st_size")) == sig):
+                current = self._current_from_row(item)
+            else:
+                current = handler.read_metadata(path)
+        except Exception as e:
+            return "failed", name, path, {}, {}, [], f"Read error: {e}"
+
+        if current.is_protected:
+            # Non-blocking skip with reason
+            return "skipped", name, path, {}, {}, [], f"Skipped protected PDF: {name}"
+
+        if current.is_corrupted:
+            return "failed", name, path, {}, {}, [], current.error_message or "Corrupted PDF"
+
+        # Empty results (e.g. "Add keywords" of ",") are not edits; only explicit clear ops clear
+        per_file_updates = {f: v for f, v in (self._compute_updates_for_file(path, current) or {}).items() if v}
+
+        # Fields to clear (lowercase keys), unless this file also updates them
+        clear_fields_l = [f for f in self._clear_fields_l if f not in per_file_updates]
+
+        # Nothing to do? benign skip
+        if not per_file_updates and not clear_fields_l:
+            return "skipped", name, path, {}, {}, [], ""
+
+        # Build journal old/new
+        old_values: Dict[str, str] = {}
+        new_values: Dict[str, str] = {}
+        for f, newv in per_file_updates.items():
+            old_values[f] = getattr(current, f, "")
+            new_values[f] = newv
+        for f in clear_fields_l:
+            old_values[f] = getattr(current, f, "")
+            new_values[f] = ""
+
+        return "write", name, path, old_values, new_values, clear_fields_l, ""
+
+    @staticmethod
+    def _write_chunks(planned: List[_Planned], workers: int) -> List[List[_Planned]]:
+        """
+        Group planned (index, path, new_values, clears) writes by identical edits, then cut
+        each group into chunks so one ExifTool run covers a chunk and the pool stays busy.
+        """
+        groups: Dict[Tuple[frozenset, Tuple[str, ...]], List[_Planned]] = {}
+        for entry in planned:
+            groups.setdefault((frozenset(entry[2].items()), tuple(entry[3])), []).append(entry)
+        chunks: List[List[_Planned]] = []
+        for group in groups.values():
+            size = max(1, min(_WRITE_CHUNK, -(-len(group) // workers)))
+            chunks.extend(group[i:i + size] for i in range(0, len(group), size))
+        return chunks
+
+    @staticmethod
+    def _write_chunk(handler: MetadataHandler, chunk: List[_Planned]) -> List[Tuple[bool, str]]:
+        items = []
+        for _i, path, new_values, clears in chunk:
+            updates = {f: v for f, v in new_values.items() if f not in clears}
+            items.append((path, updates, list(clears)))
+        # Security/protection was already checked while planning (scan or read_metadata).
+        return handler.write_metadata_batch(items)
+
     # -------------------- Thread entry --------------------
 
     def run(self) -> None:  # noqa: C901
@@ -146,113 +293,120 @@ class WriterWorker(QThread):
             handler = MetadataHandler()
         except FileNotFoundError as e:
             self.error.emit(str(e))
-            self.finished.emit({"total": 0, "successes": 0, "skipped": 0, "failures": 1}, [{"error": str(e)}], [])
+            self.finished.emit({"total": 0, "successes": 0, "skipped": 0, "failures": 1}, [{"error": str(e)}], "")
             return
 
-        total = len(self._files)
+        items = list(self._files or [])
+        total = len(items)
         done = 0
         successes = 0
         skipped = 0
-        failures: List[Dict[str, str]] = []
-        journal: List[Tuple[str, Dict[str, str], Dict[str, str]]] = []
+        # Keyed by input index so failures keep the caller's order despite completion order
+        failures_at: Dict[int, Dict[str, str]] = {}
+        journal = Journal()
+        planned: List[_Planned] = []
+        old_at: Dict[int, Dict[str, str]] = {}
         was_cancelled = False
 
         log_worker_event("Writer", "start", f"{total} file(s)")
 
-        for item in (self._files or []):
-            if self._cancel:
+        def check_cancel(futures) -> bool:
+            nonlocal was_cancelled
+            if self._cancel and not was_cancelled:
+                # Drop queued work; writes already running finish and are still journaled
                 was_cancelled = True
                 log_worker_event("Writer", "cancelled")
-                break
-
-            path = self._resolve_path(item)
-            name = os.path.basename(path) if path else "(unknown)"
-
-            # Announce start of this file so the progress label updates immediately.
-            self.file_progress.emit(0, 1, name)
-
-            if not path or not os.path.exists(path):
-                failures.append({"filename": name, "filepath": path, "error": "File not found"})
-                done += 1
-                self.file_progress.emit(1, 1, name)
-                self.progress.emit(done, total)
-                continue
-
-            # Read current metadata
-            try:
-                current = handler.read_metadata(path)
-            except Exception as e:
-                failures.append({"filename": name, "filepath": path, "error": f"Read error: {e}"})
-                done += 1
-                self.file_progress.emit(1, 1, name)
-                self.progress.emit(done, total)
-                continue
-
-            if current.is_protected:
-                # Non-blocking skip with reason
-                skipped += 1
-                done += 1
-                self.status.emit(f"Skipped protected PDF: {name}")
-                self.file_progress.emit(1, 1, name)
-                self.progress.emit(done, total)
-                continue
-
-            if current.is_corrupted:
-                failures.append({"filename": name, "filepath": path, "error": current.error_message or "Corrupted PDF"})
-                done += 1
-                self.file_progress.emit(1, 1, name)
-                self.progress.emit(done, total)
-                continue
-
-            per_file_updates = self._compute_updates_for_file(path, current) or {}
-
-            # Compute fields to clear (lowercase keys)
-            clear_fields_l = [
-                (f or "").lower()
-                for f, op in (self._ops or {}).items()
-                if (op or "").lower() == "clear" and (f or "").lower() not in per_file_updates
-            ]
-
-            # Nothing to do? benign skip
-            if not per_file_updates and not clear_fields_l:
-                skipped += 1
-                done += 1
-                self.file_progress.emit(1, 1, name)
-                self.progress.emit(done, total)
-                continue
-
-            # Build journal old/new
-            old_values: Dict[str, str] = {}
-            new_values: Dict[str, str] = {}
-            for f, newv in per_file_updates.items():
-                old_values[f] = getattr(current, f, "")
-                new_values[f] = newv
-            for f in clear_fields_l:
-                old_values[f] = getattr(current, f, "")
-                new_values[f] = ""
-
-            # Write
-            ok = True
-            err = ""
-            try:
-                if per_file_updates:
-                    # Security/protection was already checked by read_metadata() above.
-                    ok, err = handler.write_metadata(path, per_file_updates, skip_security_check=True)
-                if ok and clear_fields_l:
-                    ok, err = handler.clear_metadata_fields(path, clear_fields_l, skip_security_check=True)
-            except Exception as e:
-                ok, err = False, str(e)
-
-            if not ok:
-                failures.append({"filename": name, "filepath": path, "error": err})
-            else:
-                successes += 1
-                journal.append((path, old_values, new_values))
+                for f in futures:
+                    f.cancel()
+            return was_cancelled
 
+        def file_done(name: str) -> None:
+            nonlocal done
             done += 1
             self.file_progress.emit(1, 1, name)
             self.progress.emit(done, total)
 
+        if not self._has_any_work:
+            # No field would change on any file: all benign skips, no reads or ExifTool runs
+            done = skipped = total
+            if total:
+                self.progress.emit(done, total)
+        else:
+            # The same file listed twice (duplicate rows) is processed once; repeats are
+            # benign skips, so it is never written concurrently or journaled twice.
+            unique: List[int] = []
+            seen: set = set()
+            for i, item in enumerate(items):
+                path = self._resolve_path(item)
+                if path:
+                    canon = os.path.normcase(os.path.abspath(path))
+                    if canon in seen:
+                        skipped += 1
+                        file_done(os.path.basename(path))
+                        continue
+                    seen.add(canon)
+                unique.append(i)
+
+            # MetadataHandler holds no per-call state, so the pool threads share it.
+            ex = ThreadPoolExecutor(max_workers=self._workers)
+            try:
+                # 1) Plan every file (current values, edits, skips/failures)
+                futures = {ex.submit(self._plan_one, handler, items[i]): i for i in unique}
+                for fut in as_completed(futures):
+                    check_cancel(futures)
+                    if fut.cancelled():
+                        continue
+                    i = futures[fut]
+                    try:
+                        status, name, path, old_values, new_values, clears, msg = fut.result()
+                    except Exception as e:  # pragma: no cover - _plan_one catches IO errors itself
+                        path = self._resolve_path(items[i])
+                        status, name, old_values, new_values, clears, msg = "failed", os.path.basename(path), {}, {}, [], str(e)
+
+                    if status == "write":
+                        planned.append((i, path, new_values, tuple(clears)))
+                        old_at[i] = old_values
+                        continue
+                    if status == "skipped":
+                        skipped += 1
+                        if msg:
+                            self.status.emit(msg)
+                    else:
+                        failures_at[i] = {"filename": name, "filepath": path, "error": msg}
+                    file_done(name)
+
+                # 2) Write: one ExifTool run per chunk of files sharing the same edits
+                if not was_cancelled and planned:
+                    planned.sort(key=lambda entry: entry[0])
+                    chunks = self._write_chunks(planned, self._workers)
+                    futures = {ex.submit(self._write_chunk, handler, chunk): chunk for chunk in chunks}
+                    for fut in as_completed(futures):
+                        check_cancel(futures)
+                        if fut.cancelled():
+                            continue
+                        chunk = futures[fut]
+                        try:
+                            outcomes = fut.result()
+                        except Exception as e:  # pragma: no cover - the handler reports errors per file
+                            outcomes = [(False, str(e))] * len(chunk)
+                        for (i, path, new_values, _clears), (ok, err) in zip(chunk, outcomes):
+                            name = os.path.basename(path)
+                            if ok:
+                                successes += 1
+                                journal.append(path, old_at.pop(i), new_values)
+                            else:
+                                failures_at[i] = {"filename": name, "filepath": path, "error": err}
+                            file_done(name)
+            finally:
+                ex.shutdown(wait=True, cancel_futures=True)
+
+        journal.close()
+        failures = [failures_at[i] for i in sorted(failures_at)]
+        journal_path = journal.path
+        if not journal.count:
+            Journal.discard(journal_path)
+            journal_path = ""
+
         stats = {
             "total": total,
             "successes": successes,
@@ -265,4 +419,4 @@ class WriterWorker(QThread):
             self.status.emit(f"Write cancelled: {successes} succeeded before cancellation.")
         else:
             self.status.emit(f"Write complete: {successes} succeeded, {skipped} skipped, {len(failures)} failed.")
-        self.finished.emit(stats, failures, journal)
+        self.finished.emit(stats, failures, journal_path)